@@ -1,6 +1,6 @@
-import asyncio
-
 from src.core.Console import Console
+from src.core.utils import loop
+from src.core.utils.stats import Stats
 from src.core.utils.colors import colors
 
 _colors: dict = colors()
@@ -9,6 +9,9 @@ reset = _colors['reset']
 
 _prompt: str = 'RedCisco> '
 _config: str = 'src/config/config.json'
+_queue_size: int = 512
+_page_size: int = 16384
+_max_jobs: int = 4
 
 
 def heading():
@@ -28,6 +31,34 @@ Author:  d3d (@MCoetus)
 
 if __name__ == '__main__':
     import sys
+    import argparse
+
+    parser = argparse.ArgumentParser(description='RedCisco Command Interpreter')
+    parser.add_argument('-r', '--resource', metavar='FILE',
+                        help="run the commands in FILE ('-' for stdin) without the interactive prompt")
+    parser.add_argument('-l', '--log', metavar='FILE',
+                        help='append every printed message to FILE as JSON lines')
+    parser.add_argument('--queue-size', type=int, default=_queue_size, metavar='N',
+                        help=f'messages the print queue holds before commands wait, 0 is unbounded (default {_queue_size})')
+    parser.add_argument('--page-size', type=int, default=_page_size, metavar='N',
+                        help=f'characters printed before yielding to the prompt, 0 is unlimited (default {_page_size})')
+    parser.add_argument('--max-jobs', type=int, default=_max_jobs, metavar='N',
+                        help=f'background jobs allowed to run at once (default {_max_jobs})')
+    parser.add_argument('--loop', choices=loop.backends, default='asyncio',
+                        help='event loop backend (default asyncio)')
+    parser.add_argument('--stats', action='store_true',
+                        help="record runtime instrumentation, shown by the 'stats' command")
+    parser.add_argument('--profile', metavar='FILE',
+                        help='write a cProfile capture of the session to FILE (pstats format)')
+    args = parser.parse_args()
+    if args.queue_size < 0 or args.page_size < 0:
+        parser.error('--queue-size and --page-size must not be negative')
+    if args.max_jobs < 1:
+        parser.error('--max-jobs must be at least 1')
+    try:
+        loop.loop_factory(args.loop)
+    except ImportError:
+        parser.error(f"the '{args.loop}' event loop backend is not installed")
 
     if sys.platform == 'win32':
         """ Attempting to fix ANSI/VT100 """
@@ -35,12 +66,33 @@ if __name__ == '__main__':
         kernel32 = windll.kernel32
         kernel32.SetConsoleMode(kernel32.GetStdHandle(-11), 7)
 
-    heading()
-    console = Console(_config, _prompt)
+    script = None
+    if args.resource == '-':
+        script = sys.stdin
+    elif args.resource is not None:
+        try:
+            script = open(args.resource, 'r')
+        except OSError as e:
+            parser.error(f"can't open '{args.resource}': {e.strerror}")
+
+    if script is None:
+        heading()
+    Stats.enabled = args.stats
+    console = Console(_config, _prompt, args.queue_size, args.page_size, args.max_jobs, args.log)
+    status: int = 0
+    profiler = None
+    if args.profile:
+        import cProfile
+        profiler = cProfile.Profile()
+        profiler.enable()
     try:
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(console.main())
+        status = loop.run(console.main(script), args.loop)
     except KeyboardInterrupt:
-        pass
-    except asyncio.CancelledError:
-        pass
+        status = 130
+    finally:
+        if script is not None and script is not sys.stdin:
+            script.close()
+        if profiler is not None:
+            profiler.disable()
+            profiler.dump_stats(args.profile)
+    sys.exit(status)
@@ -0,0 +1,67 @@
+"""
+Dispatch latency micro-benchmark
+
+Compares the linear registry scan previously done by Console.interactive_shell
+against the CommandIndex lookup with a few hundred registered commands.
+
+Usage: python -m benchmarks.bench_dispatch [count]
+"""
+import asyncio
+import sys
+import timeit
+
+from src.core.base.BaseCommand import BaseCommand
+from src.core.registry.CommandIndex import CommandIndex
+from src.core.registry.CommandRegistry import global_command_registry
+
+
+def register_commands(count: int, start: int = 0) -> list:
+    names: list = []
+    for i in range(start, start + count):
+        name: str = f'command{i:04d}-bench'
+
+        async def main(self) -> None:
+            pass
+
+        type(f'BenchCommand{i:04d}', (BaseCommand,), {
+            'helper': {'name': name, 'help': '', 'usage': name},
+            'main': main,
+            'execute': main,
+        })
+        names.append(name)
+    return names
+
+
+def linear_scan(_input: str):
+    for cls in global_command_registry:
+        if not asyncio.iscoroutinefunction(global_command_registry[cls].main):
+            continue
+        command: str = _input.partition(' ')[0]
+        if command == global_command_registry[cls].helper['name']:
+            return global_command_registry[cls]
+
+
+def indexed(index: CommandIndex, _input: str):
+    return index.resolve(_input.partition(' ')[0])
+
+
+def main() -> None:
+    count: int = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    names: list = register_commands(count)
+    index: CommandIndex = CommandIndex()
+    index.sync()
+
+    # Worst case for the scan: the last registered command
+    line: str = f'{names[-1]} some arguments'
+    abbreviation: str = names[-1].partition('-')[0]
+    rounds: int = 2000
+
+    for label, func in (('linear scan', lambda: linear_scan(line)),
+                        ('index', lambda: indexed(index, line)),
+                        ('index (abbrev)', lambda: indexed(index, abbreviation))):
+        best: float = min(timeit.repeat(func, number=rounds, repeat=5)) / rounds
+        print(f'{label:<16} {count:>5} commands  {best * 1e6:10.3f} us/dispatch')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,29 @@
+"""
+Event loop backend benchmark
+
+Runs the dispatch (whole shell line) and print throughput benchmarks of the
+suite under every event loop backend installed here.
+
+Usage: python -m benchmarks.bench_loop [--quick]
+"""
+import sys
+
+from benchmarks.suite import bench_shell, bench_print
+from src.core.utils import loop
+
+
+def main() -> None:
+    quick: bool = '--quick' in sys.argv[1:]
+    for backend in loop.backends:
+        if backend not in loop.available():
+            print(f'{backend:<10} not installed, skipped')
+            continue
+        results: dict = {}
+        bench_shell(results, quick, backend)
+        bench_print(results, quick, backend)
+        for name, value in results.items():
+            print(f'{backend:<10} {name:<32} {value:12.3f}')
+
+
+if __name__ == '__main__':
+    main()
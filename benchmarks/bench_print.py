@@ -0,0 +1,90 @@
+"""
+Print pipeline benchmark
+
+Measures idle CPU use and messages/sec throughput of Console.print_processor
+against the previous 2 ms polling consumer.
+
+Usage: python -m benchmarks.bench_print [idle seconds] [messages]
+"""
+import asyncio
+import os
+import sys
+import time
+
+from src.core.Console import Console, red, green, bold, reset
+from src.core.utils.printqueue import PrintQueue
+
+
+async def legacy_print_processor(print_queue: asyncio.Queue) -> None:
+    while True:
+        while print_queue.empty() is not True:
+            _msg = await print_queue.get()
+            if isinstance(_msg, str):
+                print(f'{_msg}')
+            elif isinstance(_msg, tuple):
+                if _msg[0] == 'error':
+                    print(f'{red}{_msg[1]}{reset}')
+                elif _msg[0] == 'success':
+                    print(f'{green}{_msg[1]}{reset}')
+                elif _msg[0] == 'bold':
+                    print(f'{bold}{_msg[1]}{reset}')
+                else:
+                    print(f'{_msg[1]}')
+        await asyncio.sleep(0.002)
+
+
+def current_print_processor(print_queue: asyncio.Queue):
+    console: Console = Console.__new__(Console)
+    console.print_queue = print_queue
+    console.page_size = 0
+    console.sink = None
+    return console.print_processor()
+
+
+async def measure(factory, queue_cls, idle: float, messages: int) -> tuple:
+    print_queue: asyncio.Queue = queue_cls()
+    task = asyncio.create_task(factory(print_queue))
+
+    cpu: float = time.process_time()
+    await asyncio.sleep(idle)
+    idle_cpu: float = (time.process_time() - cpu) / idle
+
+    samples: tuple = ('plain line of output', ('error', 'error line'), ('success', 'ok'), ('bold', 'heading'))
+    # Fill the queue before yielding so only the consumer is timed
+    for i in range(messages):
+        print_queue.put_nowait(samples[i % len(samples)])
+    start: float = time.perf_counter()
+    while not print_queue.empty():
+        await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    rate: float = messages / (time.perf_counter() - start)
+
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+    return idle_cpu, rate
+
+
+def main() -> None:
+    idle: float = float(sys.argv[1]) if len(sys.argv) > 1 else 2.0
+    messages: int = int(sys.argv[2]) if len(sys.argv) > 2 else 100000
+
+    stdout = sys.stdout
+    results: list = []
+    with open(os.devnull, 'w') as devnull:
+        for label, factory, queue_cls in (('polling (before)', legacy_print_processor, asyncio.Queue),
+                                          ('event-driven (after)', current_print_processor, PrintQueue)):
+            sys.stdout = devnull
+            try:
+                results.append((label, *asyncio.run(measure(factory, queue_cls, idle, messages))))
+            finally:
+                sys.stdout = stdout
+
+    for label, idle_cpu, rate in results:
+        print(f'{label:<22} idle cpu {idle_cpu * 100:6.2f} %   throughput {rate:12,.0f} msg/s')
+
+
+if __name__ == '__main__':
+    main()
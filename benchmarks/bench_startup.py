@@ -0,0 +1,102 @@
+"""
+Console startup benchmark
+
+Launches a fresh interpreter that builds the Console up to the point where the
+first prompt would be shown, and reports wall time and peak RSS. The 'eager'
+run imports every command module up front, as the console used to. The
+'prompt' run starts RedCisco.py itself on a pseudo-terminal and waits for the
+prompt to be drawn, which also covers argument parsing, the banner and
+prompt_toolkit.
+
+Usage: python -m benchmarks.bench_startup [runs]
+"""
+import os
+import pty
+import select
+import statistics
+import subprocess
+import sys
+import time
+
+_root: str = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_prompt: bytes = b'RedCisco>'
+
+_child: str = """
+import importlib
+import resource
+import sys
+
+from src.core.Console import Console
+from src.core.command import manifest
+
+if sys.argv[1] == 'eager':
+    for module in manifest:
+        importlib.import_module(f'src.core.command.{module}')
+console = Console('src/config/config.json', 'RedCisco> ')
+console.commands.sync()
+print('ready', flush=True)
+print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss, flush=True)
+"""
+
+
+def launch(mode: str) -> tuple:
+    start: float = time.perf_counter()
+    proc = subprocess.Popen([sys.executable, '-c', _child, mode], cwd=_root,
+                            stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+    marker: str = proc.stdout.readline().strip()
+    elapsed: float = time.perf_counter() - start
+    rss: str = proc.stdout.readline().strip()
+    _, err = proc.communicate()
+    if marker != 'ready':
+        raise RuntimeError(err.strip().splitlines()[-1] if err.strip() else 'startup failed')
+    return elapsed, int(rss)
+
+
+def launch_prompt(timeout: float = 10.0) -> tuple:
+    master, slave = pty.openpty()
+    start: float = time.perf_counter()
+    proc = subprocess.Popen([sys.executable, 'RedCisco.py'], cwd=_root, stdin=slave, stdout=slave, stderr=slave)
+    os.close(slave)
+    output: bytes = b''
+    try:
+        while _prompt not in output:
+            if not select.select([master], [], [], timeout)[0]:
+                raise RuntimeError('no prompt within the timeout')
+            try:
+                output += os.read(master, 4096)
+            except OSError:
+                raise RuntimeError('exited before the prompt')
+        elapsed: float = time.perf_counter() - start
+        os.write(master, b'exit\r')
+        # Keep reading until the child closes the terminal so it never blocks on a full pty
+        while select.select([master], [], [], timeout)[0]:
+            try:
+                if not os.read(master, 4096):
+                    break
+            except OSError:
+                break
+        _, _, usage = os.wait4(proc.pid, 0)
+        proc.returncode = 0
+    finally:
+        if proc.returncode is None:
+            proc.kill()
+            proc.wait()
+        os.close(master)
+    return elapsed, usage.ru_maxrss
+
+
+def main() -> None:
+    runs: int = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    for mode in ('lazy', 'eager', 'prompt'):
+        try:
+            samples: list = [launch_prompt() if mode == 'prompt' else launch(mode) for _ in range(runs)]
+        except RuntimeError as e:
+            print(f'{mode:<6} failed: {e}')
+            continue
+        elapsed: float = statistics.median(s[0] for s in samples)
+        rss: int = max(s[1] for s in samples)
+        print(f'{mode:<6} startup {elapsed * 1000:8.1f} ms   peak rss {rss / 1024:7.1f} MiB')
+
+
+if __name__ == '__main__':
+    main()
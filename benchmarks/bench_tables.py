@@ -0,0 +1,41 @@
+"""
+Table rendering benchmark
+
+Renders an options table for a synthetic registry with thousands of options
+using PrettyTable (create_table), the dependency-free format_table and a
+cached_table hit.
+
+Usage: python -m benchmarks.bench_tables [options]
+"""
+import sys
+import timeit
+
+from src.core.utils.tables import create_table, format_table, cached_table
+
+
+def synthetic_rows(count: int) -> list:
+    return [[f'option_{i:05d}', str(i), f'Synthetic option number {i} used to benchmark table rendering']
+            for i in range(count)]
+
+
+def main() -> None:
+    count: int = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    field_names: list = [f'{"Option":<25}', f'{"Setting":<20}', f'{"Description":<30}']
+    rows: list = synthetic_rows(count)
+    cached_table('bench', 0, field_names, lambda: rows)
+
+    candidates: list = [('format_table', lambda: format_table(field_names, rows)),
+                        ('cached_table (hit)', lambda: cached_table('bench', 0, field_names, lambda: rows))]
+    try:
+        import prettytable  # noqa: F401
+        candidates.insert(0, ('PrettyTable', lambda: create_table(field_names, rows)))
+    except ImportError:
+        print(f'{"PrettyTable":<20} not installed, skipped')
+
+    for label, func in candidates:
+        best: float = min(timeit.repeat(func, number=3, repeat=3)) / 3
+        print(f'{label:<20} {count:>6} options  {best * 1000:10.3f} ms/render')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,207 @@
+"""
+Benchmark suite for the interpreter core
+
+Runs headless: the interactive shell is driven by a FakeSession instead of a
+prompt_toolkit PromptSession and all console output goes to os.devnull.
+Every metric is 'lower is better', its unit is the name suffix. Results are
+written as JSON, and when a baseline file is given the run fails on any
+metric that regressed by more than the tolerance.
+
+Usage: python -m benchmarks.suite [-o results.json] [-b baseline.json] [-t 0.25] [--loop uvloop] [--quick]
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import timeit
+
+from benchmarks.bench_dispatch import register_commands, linear_scan
+from benchmarks.bench_print import measure, current_print_processor
+from benchmarks.bench_startup import launch_prompt
+from benchmarks.bench_tables import synthetic_rows
+
+from src.core.Console import Console
+from src.core.utils import loop
+from src.core.utils.parser import parse
+from src.core.utils.printqueue import PrintQueue
+from src.core.utils.tables import format_table, cached_table
+from src.core.registry.CommandIndex import CommandIndex
+from src.core.registry.OptionsRegistry import OptionRegistry
+
+_config: str = 'src/config/config.json'
+
+
+class FakeSession(object):
+
+    def __init__(self, lines: list):
+        """
+        Class "initializer"
+
+        Stand-in for PromptSession that replays a fixed list of input lines.
+
+        :param lines: Lines returned by successive prompts
+        """
+        self.lines = iter(lines)
+
+    async def prompt_async(self, *args, **kwargs) -> str:
+        try:
+            return next(self.lines)
+        except StopIteration:
+            raise EOFError
+
+
+def best_of(func, number: int, repeat: int = 5) -> float:
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def bench_dispatch(results: dict, quick: bool, backend: str) -> None:
+    registered: int = 0
+    for size in (100, 300) if quick else (100, 300, 1000):
+        names: list = register_commands(size - registered, start=registered)
+        registered = size
+        index: CommandIndex = CommandIndex()
+        index.sync()
+        line: str = f'{names[-1]} some arguments'
+        results[f'dispatch.scan.{size}_us'] = best_of(lambda: linear_scan(line), 200) * 1e6
+        results[f'dispatch.index.{size}_us'] = best_of(lambda: index.resolve(line.partition(' ')[0]), 5000) * 1e6
+        abbreviation: str = names[-1].partition('-')[0]
+        results[f'dispatch.abbrev.{size}_us'] = best_of(lambda: index.resolve(abbreviation), 5000) * 1e6
+
+
+def bench_options(results: dict, quick: bool, backend: str) -> None:
+    count: int = 1000 if quick else 10000
+    OptionRegistry.register_options({
+        f'Synthetic Options {ns}': {
+            f'synthetic_{ns}_{i:05d}': ['false', f'Synthetic option {i}', 'true,false' if i % 2 else '']
+            for i in range(count // 10)
+        } for ns in range(10)
+    })
+    registry: OptionRegistry = OptionRegistry()
+    key: str = f'synthetic_9_{count // 10 - 1:05d}'
+    results[f'options.set.{count}_us'] = best_of(lambda: registry.set_register_value(key, 'true'), 5000) * 1e6
+    results[f'options.get.{count}_us'] = best_of(lambda: registry.get_register_value(key), 5000) * 1e6
+    results[f'options.pairs.{count}_us'] = best_of(lambda: registry.get_registry_pairs(), 5000) * 1e6
+
+
+def bench_render(results: dict, quick: bool, backend: str) -> None:
+    count: int = 1000 if quick else 5000
+    field_names: list = [f'{"Option":<25}', f'{"Setting":<20}', f'{"Description":<30}']
+    rows: list = synthetic_rows(count)
+    results[f'render.format.{count}_ms'] = best_of(lambda: format_table(field_names, rows), 3, 3) * 1e3
+    cached_table('suite', 0, field_names, lambda: rows)
+    results[f'render.cached.{count}_us'] = best_of(lambda: cached_table('suite', 0, field_names, lambda: rows), 1000) * 1e6
+
+
+def bench_parse(results: dict, quick: bool, backend: str) -> None:
+    count: int = 2000 if quick else 20000
+    script: str = ''.join(f'set ssh_bf_port={i}; set ssh_bf_username "user {i}" # line {i}\n' for i in range(count))
+    results['parse.line_us'] = best_of(lambda: parse('set ssh_bf_username = "admin user"'), 5000) * 1e6
+    results[f'parse.script.{count}_ms'] = best_of(lambda: parse(script), 3, 3) * 1e3
+
+
+async def _shell(lines: list) -> float:
+    console: Console = Console(_config, 'RedCisco> ', 512)
+    print_task = asyncio.create_task(console.print_processor())
+    start: float = time.perf_counter()
+    await console.interactive_shell(FakeSession(lines))
+    await console.print_queue.join()
+    elapsed: float = time.perf_counter() - start
+    print_task.cancel()
+    try:
+        await print_task
+    except asyncio.CancelledError:
+        pass
+    return elapsed
+
+
+def bench_shell(results: dict, quick: bool, backend: str) -> None:
+    rounds: int = 20 if quick else 100
+    stdout = sys.stdout
+    with open(os.devnull, 'w') as devnull:
+        sys.stdout = devnull
+        try:
+            for name, line in (('help', 'help'), ('options', 'options'), ('set', 'set ssh_bf_port 2222')):
+                # Warm up once so lazy command loading is not part of the measurement
+                loop.run(_shell([line]), backend)
+                results[f'shell.{name}_us'] = loop.run(_shell([line] * rounds), backend) / rounds * 1e6
+        finally:
+            sys.stdout = stdout
+
+
+def bench_print(results: dict, quick: bool, backend: str) -> None:
+    messages: int = 20000 if quick else 100000
+    idle: float = 0.5 if quick else 2.0
+    stdout = sys.stdout
+    with open(os.devnull, 'w') as devnull:
+        sys.stdout = devnull
+        try:
+            idle_cpu, rate = loop.run(measure(current_print_processor, PrintQueue, idle, messages), backend)
+        finally:
+            sys.stdout = stdout
+    results['print.idle_cpu_percent'] = idle_cpu * 100
+    results['print.message_us'] = 1e6 / rate
+
+
+def bench_startup(results: dict, quick: bool, backend: str) -> None:
+    samples: list = [launch_prompt() for _ in range(3 if quick else 10)]
+    results['startup.time_ms'] = statistics.median(s[0] for s in samples) * 1e3
+    results['startup.rss_mib'] = max(s[1] for s in samples) / 1024
+
+
+# The shell benchmarks run first: bench_dispatch and bench_options fill the global
+# registries with synthetic commands and options, which 'help' and 'options' would then render
+_benchmarks: tuple = (bench_shell, bench_print, bench_startup, bench_dispatch, bench_options, bench_render, bench_parse)
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list:
+    regressions: list = []
+    for name, value in results.items():
+        previous = baseline.get(name)
+        if previous and value > previous * (1 + tolerance):
+            regressions.append(f'{name}: {previous:.3f} -> {value:.3f} (+{(value / previous - 1) * 100:.0f}%)')
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='RedCisco interpreter benchmark suite')
+    parser.add_argument('-o', '--output', metavar='FILE', help='write the results to FILE as JSON')
+    parser.add_argument('-b', '--baseline', metavar='FILE', help='fail on regressions against a previous results FILE')
+    parser.add_argument('-t', '--tolerance', type=float, default=0.25, help='allowed slowdown ratio (default 0.25)')
+    parser.add_argument('--loop', choices=loop.backends, default='asyncio', help='event loop backend (default asyncio)')
+    parser.add_argument('--quick', action='store_true', help='smaller registries and fewer rounds')
+    args = parser.parse_args()
+
+    results: dict = {}
+    for bench in _benchmarks:
+        bench(results, args.quick, args.loop)
+
+    for name, value in results.items():
+        print(f'{name:<32} {value:12.3f}')
+
+    report: dict = {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'time': time.time(),
+        'quick': args.quick,
+        'loop': args.loop,
+        'results': results
+    }
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, 'r') as f:
+            regressions: list = compare(results, json.load(f)['results'], args.tolerance)
+        for regression in regressions:
+            print(f'REGRESSION {regression}')
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
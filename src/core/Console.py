@@ -1,13 +1,22 @@
+import os
+import sys
+import stat
 import asyncio
 import signal
+import threading
 
-from ruamel.yaml import YAML, YAMLError
-
-# noinspection PyUnresolvedReferences
-from src.core.command import *
 from src.core.utils.colors import colors
+from src.core.utils.stats import Stats
+from src.core.utils.jsonl import JsonlSink
+from src.core.utils.config import load_config
+from src.core.utils.completer import ConsoleCompleter
+from src.core.utils.message import Message
+from src.core.utils.parser import ParseError, parse
+from src.core.utils.printqueue import PrintQueue
+from src.core.Dispatcher import Dispatcher
 from src.core.base.BaseConsole import BaseConsole
-from src.core.registry.CommandRegistry import global_command_registry
+from src.core.registry.CommandIndex import CommandIndex, global_command_index
+from src.core.registry.JobRegistry import JobRegistry
 from src.core.registry.OptionsRegistry import OptionRegistry
 
 from prompt_toolkit.patch_stdout import patch_stdout
@@ -22,88 +31,268 @@ reset = _colors['reset']
 
 _prompt_style = Style.from_dict({"prompt": "ansired bold"})
 
+_styles: dict = {
+    'title': (red, reset),
+    'error': (red, reset),
+    'success': (green, reset),
+    'bold': (bold, reset)
+}
+_no_style: tuple = ('', '')
+
+
+def _render(_msg: Message) -> str:
+    start, end = _styles.get(_msg.level, _no_style)
+    return f'{start}{_msg.text}{end}{_msg.end}'
+
+
+def _discard_stdout() -> None:
+    # Point stdout at os.devnull so buffered and later output is dropped instead of raising again
+    try:
+        devnull: int = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        os.close(devnull)
+    except (OSError, ValueError, AttributeError):
+        sys.stdout = open(os.devnull, 'w')
+
+
+def _is_regular_file(source) -> bool:
+    try:
+        return stat.S_ISREG(os.fstat(source.fileno()).st_mode)
+    except (AttributeError, OSError, ValueError):
+        return False
+
+
+def _may_complete(incomplete: str, text: str) -> bool:
+    if incomplete == '\n':
+        # A line that ends in another escape continues the command again
+        return not text.rstrip('\r\n').endswith('\\')
+    return incomplete in text
+
+
+async def _read_lines(source, limit: int = 64):
+    # Blocking reads happen on a daemon thread, so a prompt-less stdin never stalls the loop or the exit.
+    # The thread waits while 'limit' lines are queued, so a large piped script is read as it runs.
+    if not hasattr(source, 'readline'):
+        for text in source:
+            yield text
+        return
+    loop = asyncio.get_running_loop()
+    lines: asyncio.Queue = asyncio.Queue()
+    room: threading.Semaphore = threading.Semaphore(limit)
+
+    def put(text) -> None:
+        room.acquire()
+        loop.call_soon_threadsafe(lines.put_nowait, text)
+
+    def reader() -> None:
+        try:
+            try:
+                for text in iter(source.readline, ''):
+                    put(text)
+            except (OSError, ValueError):
+                # Unreadable input ends the script
+                pass
+            put(None)
+        except RuntimeError:
+            # The loop closed while the script was running
+            pass
+
+    threading.Thread(target=reader, name='Thread-ScriptReader', daemon=True).start()
+    while True:
+        text: str = await lines.get()
+        room.release()
+        if text is None:
+            return
+        yield text
+
 
 class Console(BaseConsole):
 
-    def __init__(self, config: str, prompt: str):
+    def __init__(self, config: str, prompt: str, queue_size: int = 0, page_size: int = 0, max_jobs: int = 4,
+                 log: str = None):
         self.prompt: str = prompt
+        self.page_size: int = page_size
+        self.sink: JsonlSink = JsonlSink(log) if log else None
+        self.print_task = None
+        self.monitor_task = None
+        self.main_task = None
+        self.received_signal: int = 0
         self.end_points: list = []
-        self.print_queue: asyncio.Queue = asyncio.Queue()
+        self.print_queue: PrintQueue = PrintQueue(queue_size)
         self.registry: OptionRegistry = OptionRegistry()
+        self.commands: CommandIndex = global_command_index
+        self.dispatcher: Dispatcher = Dispatcher(self.print_queue, self.commands)
+        JobRegistry.set_limit(max_jobs)
 
         self.__register(config, self.registry)
 
     @staticmethod
     def __register(_config: str, _registry: OptionRegistry) -> None:
-        yaml = YAML()
         try:
-            with open(_config, "r") as conf:
-                _registry.register_options(yaml.load(conf))
-        except YAMLError:
+            _registry.register_options(load_config(_config))
+        except (OSError, ValueError):
             print(f"Error occurred while processing configuration file: {_config}")
             exit(1)
 
-    async def interactive_shell(self) -> None:
-        session = PromptSession()
+    async def interactive_shell(self, session=None) -> None:
+        if session is None:
+            session = PromptSession(completer=ConsoleCompleter(self.commands, self.registry))
         while True:
             try:
                 _input: str = await session.prompt_async(self.prompt, style=_prompt_style)
                 if not _input:
                     continue
-
-                for cls in global_command_registry:
-                    if not asyncio.iscoroutinefunction(global_command_registry[cls].main):
-                        continue
-                    command: str = _input.partition(' ')[0]
-                    if command == global_command_registry[cls].helper['name']:
-                        await asyncio.gather(global_command_registry[cls](_input, self.print_queue).main())
+                await self.dispatcher.dispatch(_input)
             except (EOFError, KeyboardInterrupt):
                 break
 
+    async def script_shell(self, source) -> int:
+        status: int = 0
+        failed: int = JobRegistry.failed
+        try:
+            async for line in self.__script_commands(source):
+                if not await self.dispatcher.run(line):
+                    status = 1
+                # Let the print processor stream this command's output before the next one
+                await asyncio.sleep(0)
+        except ParseError as e:
+            await self.print_queue.put(('error', f"{e}\n"))
+            status = 1
+        except EOFError:
+            pass
+        # Background jobs started by the script finish before it does, and their failures count
+        await JobRegistry.wait_jobs()
+        if JobRegistry.failed > failed:
+            status = 1
+        return status
+
+    @staticmethod
+    async def __script_commands(source):
+        # Regular files are parsed up front, a syntax error anywhere runs none of the script
+        if isinstance(source, str) or _is_regular_file(source):
+            for line in parse(source if isinstance(source, str) else source.read()):
+                yield line
+            return
+
+        # Pipes and terminals are parsed as lines arrive, holding back a command left open by a quote or escape
+        pending: str = ''
+        lineno: int = 1
+        incomplete: str = ''
+        async for text in _read_lines(source):
+            pending += text
+            # Only parse again once the new line could close the open quote or escape
+            if incomplete and not _may_complete(incomplete, text):
+                continue
+            try:
+                commands: list = parse(pending, lineno)
+            except ParseError as e:
+                if e.incomplete:
+                    incomplete = e.incomplete
+                    continue
+                raise
+            lineno += pending.count('\n')
+            pending, incomplete = '', ''
+            for line in commands:
+                yield line
+        for line in parse(pending, lineno):
+            yield line
+
     async def print_processor(self) -> None:
         while True:
+            # Sleep on the queue while idle, then flush everything waiting in a single write
+            messages: list = [await self.__next_message()]
+            batch: list = [_render(messages[0])]
+            size: int = len(batch[0])
+            while not self.print_queue.empty() and (not self.page_size or size < self.page_size):
+                messages.append(self.print_queue.get_nowait())
+                batch.append(_render(messages[-1]))
+                size += len(batch[-1])
             try:
-                while self.print_queue.empty() is not True:
-                    _msg = await self.print_queue.get()
-                    if isinstance(_msg, str):
-                        print(f'{_msg}')
-                    elif isinstance(_msg, tuple):
-                        if _msg[0] == 'error':
-                            print(f'{red}{_msg[1]}{reset}')
-                        elif _msg[0] == 'success':
-                            print(f'{green}{_msg[1]}{reset}')
-                        elif _msg[0] == 'bold':
-                            print(f'{bold}{_msg[1]}{reset}')
-                        else:
-                            print(f'{_msg[1]}')
-                await asyncio.sleep(0.002)
-            except asyncio.CancelledError:
-                await self.shutdown(asyncio.get_running_loop())
+                sys.stdout.write(''.join(batch))
+                sys.stdout.flush()
+            except OSError:
+                # The reader went away (e.g. '| head'), keep draining so producers never block on a full queue
+                _discard_stdout()
+            if Stats.enabled:
+                Stats.record_batch(len(messages) + self.print_queue.qsize(), messages)
+            if self.sink is not None:
+                self.sink.write(messages)
+            for _ in messages:
+                self.print_queue.task_done()
+            if self.page_size and size >= self.page_size:
+                # Hand the loop back to the prompt between pages of a large result
+                await asyncio.sleep(0)
 
-    @staticmethod
-    async def shutdown(_loop) -> None:
-        print(f'Closing application gracefully!')
-        print(f'Stopping all running tasks...')
-        tasks = [t.cancel() for t in asyncio.all_tasks() if t is not asyncio.current_task()]
-        await asyncio.gather(*tasks)
-        _loop.stop()
-
-    async def main(self) -> None:
-        asyncio.current_task().set_name('Task-Main')
+    async def __next_message(self) -> Message:
+        # Wake up in time to flush the session log when it holds buffered messages
+        while self.sink is not None and self.sink.pending:
+            try:
+                return await asyncio.wait_for(self.print_queue.get(), self.sink.max_delay)
+            except asyncio.TimeoutError:
+                self.sink.flush()
+        return await self.print_queue.get()
+
+    async def shutdown(self, timeout: float = 5.0) -> None:
+        loop = asyncio.get_running_loop()
+        deadline: float = loop.time() + timeout
+
+        # Reap background jobs first so their last messages still get printed
+        try:
+            await asyncio.wait_for(JobRegistry.cancel_jobs(), max(deadline - loop.time(), 0))
+        except asyncio.TimeoutError:
+            pass
+
+        if self.print_task is not None and not self.print_task.done():
+            try:
+                await asyncio.wait_for(self.print_queue.join(), max(deadline - loop.time(), 0))
+            except asyncio.TimeoutError:
+                pass
+
+        tasks: list = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+        for t in tasks:
+            t.cancel()
+        if tasks:
+            await asyncio.wait(tasks, timeout=max(deadline - loop.time(), 0))
+
+        if self.sink is not None:
+            self.sink.close()
+
+    def __interrupt(self, signum: int) -> None:
+        # Remember the signal so the exit status tells a terminate from an interrupt
+        self.received_signal = signum
+        self.main_task.cancel()
+
+    async def main(self, script=None) -> int:
+        main_task = self.main_task = asyncio.current_task()
+        main_task.set_name('Task-Main')
         loop = asyncio.get_running_loop()
         signals = (signal.SIGINT, signal.SIGTERM)
 
         for s in signals:
             try:
-                loop.add_signal_handler(s, lambda _s=s: asyncio.create_task(self.shutdown(loop)))
+                loop.add_signal_handler(s, self.__interrupt, s)
             except NotImplementedError:
                 pass
 
-        with patch_stdout():
-            print_task = asyncio.create_task(self.print_processor(), name='Task-PrintQueue')
-            try:
-                await self.interactive_shell()
-            except asyncio.CancelledError:
-                pass
-            finally:
-                print_task.cancel()
+        self.print_task = asyncio.create_task(self.print_processor(), name='Task-PrintQueue')
+        if Stats.enabled:
+            Stats.watch_queue(self.print_queue)
+            self.monitor_task = asyncio.create_task(Stats.monitor_loop(), name='Task-LoopMonitor')
+
+        status: int = 0
+        try:
+            if script is not None:
+                # Script mode: no prompt rendering, output streams straight to stdout
+                status = await self.script_shell(script)
+            else:
+                with patch_stdout():
+                    await self.interactive_shell()
+        except asyncio.CancelledError:
+            if hasattr(main_task, 'uncancel'):
+                main_task.uncancel()
+            print(f'Closing application gracefully!')
+            print(f'Stopping all running tasks...')
+            status = 128 + (self.received_signal or signal.SIGINT)
+        finally:
+            await self.shutdown()
+        return status
@@ -0,0 +1,88 @@
+import asyncio
+import time
+
+from src.core.utils.stats import Stats
+from src.core.utils.parser import CommandLine, ParseError, parse
+from src.core.utils.message import MessageWriter
+from src.core.registry.JobRegistry import JobRegistry, JobOutput
+from src.core.registry.CommandIndex import AmbiguousCommandError, CommandIndex, global_command_index
+
+
+class Dispatcher(object):
+
+    def __init__(self, print_queue: asyncio.Queue, commands: CommandIndex = global_command_index):
+        """
+        Class "initializer"
+
+        Runs command lines independently of where they were read from, so the
+        interactive prompt and script mode share one code path. Lines are parsed
+        once into CommandLine records which are handed to the commands as is.
+
+        :param print_queue: Asynchronous print queue
+        :param commands: Command dispatch index
+        """
+        self.print_queue: asyncio.Queue = print_queue
+        self.commands: CommandIndex = commands
+
+    async def dispatch(self, _input: str) -> bool:
+        """
+        Coroutine that parses a command line and runs each of its commands in order
+
+        :param _input: User-supplied command line, ';' separates commands and '&' runs one in the background
+        :return: True when every command ran without error
+        """
+        try:
+            commands: list = parse(_input)
+        except ParseError as e:
+            await self.print_queue.put(('error', f"{e}\n"))
+            return False
+        status: bool = True
+        for line in commands:
+            if not await self.run(line):
+                status = False
+        return status
+
+    async def run(self, line: CommandLine) -> bool:
+        """
+        Coroutine that resolves and runs a single parsed command
+
+        :param line: Parsed command
+        :return: True when the command ran without raising or printing an error
+        """
+        if not Stats.enabled:
+            return await self._run(line)
+        start: float = time.perf_counter()
+        try:
+            return await self._run(line)
+        finally:
+            Stats.record('dispatch', time.perf_counter() - start)
+
+    async def _run(self, line: CommandLine) -> bool:
+        command: str = line.name
+        try:
+            cls = self.commands.resolve(command)
+        except ImportError as e:
+            await self.print_queue.put(('error', f"Unable to load command '{command}': {e}\n"))
+            return False
+        except AmbiguousCommandError as e:
+            await self.print_queue.put(('error', f"{e}\n"))
+            return False
+        if cls is None:
+            await self.print_queue.put(('error', f"Unknown command '{command}'\n"))
+            return False
+
+        if line.background:
+            job = JobRegistry.submit(line, cls, JobOutput(self.print_queue, self.commands.canonical(command)))
+            await self.print_queue.put(('bold', f"[{job.id}] {job.command}\n"))
+            return True
+
+        output: MessageWriter = MessageWriter(self.print_queue, self.commands.canonical(command))
+        try:
+            await cls(line, output).main()
+        except EOFError:
+            raise
+        except Exception as e:
+            await self.print_queue.put(('error', f"Command '{command}' failed: {e}\n"))
+            return False
+        # Commands report failures as error messages, which count like an exception
+        return not output.failed
@@ -1,3 +1,4 @@
+from src.core.utils.stats import Stats
 from src.core.base.abstract.AbstractCommand import AbstractCommand
 from src.core.registry.CommandRegistry import CommandRegistry
 
@@ -7,6 +8,10 @@ class BaseCommand(AbstractCommand):
     def __init_subclass__(cls, **kwargs) -> None:
         try:
             assert isinstance(cls, type(BaseCommand))
+            # Decided once at class creation, commands load lazily after the --stats flag is read,
+            # so without instrumentation main runs unwrapped
+            if Stats.enabled and 'main' in cls.__dict__:
+                cls.main = Stats.timed(getattr(cls, 'helper', {}).get('name', cls.__name__), cls.main)
             CommandRegistry(cls)
             super().__init_subclass__(**kwargs)
         except AssertionError:
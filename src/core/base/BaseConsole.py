@@ -12,13 +12,22 @@ class BaseConsole(AbstractConsole):
         :return: None
         """
 
-    async def interactive_shell(self) -> None:
+    async def interactive_shell(self, session=None) -> None:
         """
         Base Coroutine that will handle user-supplied commands
 
+        :param session: Optional object providing 'prompt_async', defaults to a PromptSession
         :return: None
         """
 
+    async def script_shell(self, source) -> int:
+        """
+        Base Coroutine that will run commands read from a script or stdin
+
+        :param source: Script text or an iterable of its lines
+        :return: Exit status
+        """
+
     async def print_processor(self) -> None:
         """
         Base Coroutine that will handle the print queue
@@ -26,18 +35,21 @@ class BaseConsole(AbstractConsole):
         :return: None
         """
 
-    @staticmethod
-    async def shutdown(_loop) -> None:
+    async def shutdown(self, timeout: float = 5.0) -> None:
         """
         Base Coroutine that gracefully shuts down application
 
-        :param _loop: Main Event Loop
+        Reaps background jobs, drains the print queue and waits for the
+        remaining tasks to unwind, all within the timeout.
+
+        :param timeout: Seconds allowed for the whole shutdown
         :return: None
         """
 
-    async def main(self) -> None:
+    async def main(self, script=None) -> int:
         """
         Base Coroutine that starts the event loops
 
-        :return: None
+        :param script: Optional iterable of command lines to run without a prompt
+        :return: Exit status
         """
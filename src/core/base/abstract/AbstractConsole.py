@@ -4,13 +4,23 @@ import abc
 class AbstractConsole(metaclass=abc.ABCMeta):
 
     @abc.abstractmethod
-    async def interactive_shell(self) -> None:
+    async def interactive_shell(self, session=None) -> None:
         """
         Abstract Coroutine that will handle user-supplied commands
 
+        :param session: Optional object providing 'prompt_async', defaults to a PromptSession
         :return: None
         """
 
+    @abc.abstractmethod
+    async def script_shell(self, source) -> int:
+        """
+        Abstract Coroutine that will run commands read from a script or stdin
+
+        :param source: Script text or an iterable of its lines
+        :return: Exit status
+        """
+
     @abc.abstractmethod
     async def print_processor(self) -> None:
         """
@@ -19,20 +29,20 @@ class AbstractConsole(metaclass=abc.ABCMeta):
         :return: None
         """
 
-    @staticmethod
     @abc.abstractmethod
-    async def shutdown(_loop) -> None:
+    async def shutdown(self, timeout: float = 5.0) -> None:
         """
         Abstract Coroutine that gracefully shuts down application
 
-        :param _loop: Main Event Loop
+        :param timeout: Seconds allowed for the whole shutdown
         :return: None
         """
 
     @abc.abstractmethod
-    async def main(self) -> None:
+    async def main(self, script=None) -> int:
         """
         Abstract Coroutine that starts the event loops
 
-        :return: None
+        :param script: Optional iterable of command lines to run without a prompt
+        :return: Exit status
         """
@@ -1,26 +1,25 @@
 import asyncio
 
+from src.core.utils.parser import CommandLine
+
+from src.core.command import manifest
 from src.core.base.BaseCommand import BaseCommand
 
 
 class ExitCommand(BaseCommand):
 
-    helper = {
-        'name': 'exit',
-        'help': 'This command will exit the application',
-        'usage': 'exit'
-    }
+    helper = manifest['ExitCommand']
 
-    def __init__(self, command: str, print_queue: asyncio.Queue):
+    def __init__(self, command: CommandLine, print_queue: asyncio.Queue):
         """
         Class 'Constructor-Like' Initializer
 
-        :param command: User-input command
+        :param command: Parsed command line
         :param print_queue: Print Queue
         :return None
         """
         super().__init__()
-        self.command: str = command
+        self.command: CommandLine = command
         self.pq: asyncio.Queue = print_queue
 
     async def main(self) -> None:
@@ -1,33 +1,27 @@
 import asyncio
 
-from src.core.utils.colors import colors
-from src.core.utils.tables import create_table
+from src.core.utils.tables import cached_table
+from src.core.utils.parser import CommandLine
 
+from src.core.command import manifest
 from src.core.base.BaseCommand import BaseCommand
-from src.core.registry.CommandRegistry import global_command_registry
-
-_colors: dict = colors()
-red = _colors['red']
-reset = _colors['reset']
+from src.core.registry.CommandIndex import global_command_index
+from src.core.registry.CommandRegistry import CommandRegistry
 
 
 class HelpCommand(BaseCommand):
 
-    helper = {
-        'name': 'help',
-        'help': 'This command prints all available help information',
-        'usage': 'help'
-    }
+    helper = manifest['HelpCommand']
 
-    def __init__(self, command: str, print_queue: asyncio.Queue):
+    def __init__(self, command: CommandLine, print_queue: asyncio.Queue):
         """
         Class "initializer"
 
-        :param command: User-supplied input
+        :param command: Parsed command line
         :param print_queue: Asynchronous print queue
         """
         super().__init__()
-        self.command: str = command
+        self.command: CommandLine = command
         self.pq: asyncio.Queue = print_queue
 
     async def main(self) -> None:
@@ -44,11 +38,17 @@ class HelpCommand(BaseCommand):
 
         :returns: None
         """
-        await self.pq.put((red, f'\nCore Commands\n{"=" * 13}\n'))
+        await self.pq.put(('title', f'\nCore Commands\n{"=" * 13}\n'))
         field_names = [f'{"Command":<25}', f'{"Usage":<20}', f'{"Description":<30}']
-        field_values = []
-        for cls in global_command_registry:
-            info = global_command_registry[cls].helper
-            field_values.append([info['name'], info['usage'], info['help']])
-        output: str = create_table(field_names, field_values)
+        global_command_index.sync()
+        output: str = cached_table('help', CommandRegistry.version, field_names, self.rows)
         await self.pq.put(f'{output}\n')
+
+    @staticmethod
+    def rows() -> list:
+        """
+        Builds the help table rows from the command index metadata
+
+        :returns: List of rows
+        """
+        return [[info['name'], info['usage'], info['help']] for info in global_command_index.helpers.values()]
@@ -0,0 +1,58 @@
+import asyncio
+
+from src.core.utils.tables import format_table
+from src.core.utils.parser import CommandLine
+
+from src.core.command import manifest
+from src.core.base.BaseCommand import BaseCommand
+from src.core.registry.JobRegistry import JobRegistry
+
+
+class JobsCommand(BaseCommand):
+
+    helper = manifest['JobsCommand']
+
+    def __init__(self, command: CommandLine, print_queue: asyncio.Queue):
+        """
+        Class "initializer"
+
+        :param command: Parsed command line
+        :param print_queue: Asynchronous print queue
+        """
+        super().__init__()
+        self.command: CommandLine = command
+        self.pq: asyncio.Queue = print_queue
+        self.jobs: JobRegistry = JobRegistry()
+
+    async def main(self) -> None:
+        """
+        Coroutine that starts command logic
+
+        :returns: None
+        """
+        await self.execute()
+
+    async def execute(self) -> None:
+        """
+        Coroutine that handles any execution logic
+
+        :returns: None
+        """
+        if self.command.args:
+            job = self.jobs.get_job(self.command.args[0])
+            if job is None:
+                await self.pq.put(('error', f"No job with id '{self.command.args[0]}'\n"))
+                return
+            await self.pq.put(('bold', f"[{job.id}] {job.command} ({job.state})\n"))
+            for item in list(job.output):
+                await self.pq.put(item)
+            return
+
+        jobs: list = self.jobs.get_jobs()
+        if not jobs:
+            await self.pq.put('No background jobs\n')
+            return
+        field_names: list = [f'{"Id":<5}', f'{"State":<10}', f'{"Runtime":<10}', f'{"Command":<30}']
+        field_values: list = [[job.id, job.state, f'{job.runtime():.1f}s', job.command] for job in jobs]
+        await self.pq.put(('bold', f'\nBackground Jobs\n{"=" * 15}\n'))
+        await self.pq.put(f'{format_table(field_names, field_values)}\n')
@@ -1,8 +1,10 @@
 import asyncio
 
 from src.core.utils.colors import colors
-from src.core.utils.tables import create_table
+from src.core.utils.tables import cached_table
+from src.core.utils.parser import CommandLine
 
+from src.core.command import manifest
 from src.core.base.BaseCommand import BaseCommand
 from src.core.registry.OptionsRegistry import OptionRegistry
 
@@ -13,21 +15,17 @@ reset = _colors['reset']
 
 class CommandOptions(BaseCommand):
 
-    helper = {
-        'name': 'options',
-        'help': 'This command prints all available options',
-        'usage': 'options'
-    }
+    helper = manifest['OptionsCommand']
 
-    def __init__(self, command: str, print_queue: asyncio.Queue):
+    def __init__(self, command: CommandLine, print_queue: asyncio.Queue):
         """
         Class "initializer"
 
-        :param command: User-supplied input
+        :param command: Parsed command line
         :param print_queue: Asynchronous print queue
         """
         super().__init__()
-        self.command: str = command
+        self.command: CommandLine = command
         self.pq: asyncio.Queue = print_queue
         self.registry: OptionRegistry = OptionRegistry()
 
@@ -49,9 +47,16 @@ class CommandOptions(BaseCommand):
         for x in options.keys():
             await self.pq.put(f'\n{x}\n{"=" * len(x)}\n')
             field_names: list = [f'{"Option":<25}', f'{"Setting":<20}', f'{"Description":<30}']
-            field_values: list = []
-            for item in options[x].items():
-                field_values.append([item[0], item[1][0], item[1][1]])
-            output: str = create_table(field_names, field_values)
+            output: str = cached_table(f'options:{x}', self.registry.version, field_names, lambda: self.rows(options[x]))
             await self.pq.put(output)
             await self.pq.put('')
+
+    @staticmethod
+    def rows(options: dict) -> list:
+        """
+        Builds the table rows of an option namespace
+
+        :param options: Namespace options
+        :returns: List of rows
+        """
+        return [[item[0], item[1][0], item[1][1]] for item in options.items()]
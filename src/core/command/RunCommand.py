@@ -1,21 +1,20 @@
 import asyncio
 import netdev
 
+from src.core.utils.parser import CommandLine
+
+from src.core.command import manifest
 from src.core.base.BaseCommand import BaseCommand
 from src.core.registry.OptionsRegistry import OptionRegistry
 
 
 class RunCommand(BaseCommand):
 
-    helper = {
-        'name': 'run',
-        'help': 'This command will start the connection process',
-        'usage': 'run'
-    }
+    helper = manifest['RunCommand']
 
-    def __init__(self, command: str, print_queue: asyncio.Queue):
+    def __init__(self, command: CommandLine, print_queue: asyncio.Queue):
         super().__init__()
-        self.command: str = command
+        self.command: CommandLine = command
         self.print_queue: asyncio.Queue = print_queue
         self.options: OptionRegistry = OptionRegistry()
         self.end_points: list = []
@@ -1,26 +1,25 @@
 import asyncio
 
+from src.core.utils.parser import CommandLine
+
+from src.core.command import manifest
 from src.core.base.BaseCommand import BaseCommand
 from src.core.registry.OptionsRegistry import OptionRegistry
 
 
 class CommandSet(BaseCommand):
 
-    helper = {
-        'name': 'set',
-        'help': 'This command will set an option value',
-        'usage': 'set'
-    }
+    helper = manifest['SetCommand']
 
-    def __init__(self, command: str, print_queue: asyncio.Queue):
+    def __init__(self, command: CommandLine, print_queue: asyncio.Queue):
         """
         Class "initializer"
 
-        :param command: User-supplied input
+        :param command: Parsed command line
         :param print_queue: None
         """
         super().__init__()
-        self.command: str = command
+        self.command: CommandLine = command
         self.pq: asyncio.Queue = print_queue
         self.options: OptionRegistry = OptionRegistry()
 
@@ -38,17 +37,23 @@ class CommandSet(BaseCommand):
 
         :returns: None
         """
-        if len(self.command.split()) < 3:
+        # 'set key value...', 'set key=value' and 'set key = value' all arrive parsed
+        if self.command.params:
+            (key, value), = self.command.params.items()
+            if self.command.args:
+                await self.pq.put(('error', f"Quote values that contain spaces: set {key}=\"...\"\n"))
+                return
+        elif len(self.command.args) > 1:
+            key, value = self.command.args[0], ' '.join(self.command.args[1:])
+        else:
+            await self.pq.put(('error', f"Usage: {self.helper['usage']}\n"))
             return
 
-        _parts: list = self.command.split()
-
-        # Fix user input styles when setting option values
-        if _parts[2] == '=':
-            _parts.remove('=')
-        if _parts[2] == '\"\"':
-            _parts[2] = ''
-        _, key, *value = tuple(_parts)
-
-        if key in self.options.get_registry_pairs().keys():
-            await self.pq.put(self.options.set_register_value(key, ' '.join(value)))
+        if self.options.get_register_value(key) is None:
+            await self.pq.put(('error', f"Unknown option '{key}'\n"))
+            return
+        allowed: list = self.options.get_allowed_values(key)
+        if allowed and value not in allowed:
+            await self.pq.put(('error', f"{value} is not in the list of allowed values: {allowed}\n"))
+            return
+        await self.pq.put(self.options.set_register_value(key, value))
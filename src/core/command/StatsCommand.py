@@ -0,0 +1,70 @@
+import asyncio
+
+from src.core.utils.stats import Stats
+from src.core.utils.tables import format_table
+from src.core.utils.parser import CommandLine
+
+from src.core.command import manifest
+from src.core.base.BaseCommand import BaseCommand
+
+
+class StatsCommand(BaseCommand):
+
+    helper = manifest['StatsCommand']
+
+    def __init__(self, command: CommandLine, print_queue: asyncio.Queue):
+        """
+        Class "initializer"
+
+        :param command: Parsed command line
+        :param print_queue: Asynchronous print queue
+        """
+        super().__init__()
+        self.command: CommandLine = command
+        self.pq: asyncio.Queue = print_queue
+
+    async def main(self) -> None:
+        """
+        Coroutine that starts command logic
+
+        :returns: None
+        """
+        await self.execute()
+
+    async def execute(self) -> None:
+        """
+        Coroutine that handles any execution logic
+
+        :returns: None
+        """
+        if not Stats.enabled:
+            await self.pq.put(('error', 'Instrumentation is disabled, start the console with --stats\n'))
+            return
+
+        field_names: list = [f'{"Name":<20}', f'{"Count":<8}', f'{"Mean":<10}', f'{"p50":<10}', f'{"p95":<10}',
+                             f'{"Max":<10}']
+        timings: list = [(f'command {name}', h) for name, h in sorted(Stats.latency.items()) if name != 'dispatch']
+        if 'dispatch' in Stats.latency:
+            timings.insert(0, ('dispatch', Stats.latency['dispatch']))
+        timings += [('print queue wait', Stats.queue_wait), ('event loop lag', Stats.loop_lag)]
+
+        await self.pq.put(('title', f'\nLatency (ms)\n{"=" * 12}\n'))
+        await self.pq.put(f'{format_table(field_names, [self.row(name, h, 1e-3) for name, h in timings])}\n')
+        await self.pq.put(('title', f'\nPrint Queue Depth\n{"=" * 17}\n'))
+        await self.pq.put(f'{format_table(field_names, [self.row("messages", Stats.queue_depth, 1)])}\n')
+        if Stats.print_queue is not None:
+            bound: str = str(Stats.print_queue.maxsize) if Stats.print_queue.maxsize else 'unbounded'
+            await self.pq.put(f'  High-water mark {Stats.print_queue.high_water_mark} of {bound} (--queue-size)\n')
+
+    @staticmethod
+    def row(name: str, histogram, scale: float) -> list:
+        """
+        Builds a table row from a histogram
+
+        :param name: Row name
+        :param histogram: Histogram
+        :param scale: Factor applied to the recorded values
+        :returns: Table row
+        """
+        values: list = [histogram.mean(), histogram.percentile(50), histogram.percentile(95), histogram.max]
+        return [name, histogram.count] + [f'{v * scale:.3f}' if scale != 1 else f'{v:.0f}' for v in values]
@@ -0,0 +1,53 @@
+import asyncio
+
+from src.core.utils.parser import CommandLine
+
+from src.core.command import manifest
+from src.core.base.BaseCommand import BaseCommand
+from src.core.registry.JobRegistry import JobRegistry
+
+
+class WaitCommand(BaseCommand):
+
+    helper = manifest['WaitCommand']
+
+    def __init__(self, command: CommandLine, print_queue: asyncio.Queue):
+        """
+        Class "initializer"
+
+        :param command: Parsed command line
+        :param print_queue: Asynchronous print queue
+        """
+        super().__init__()
+        self.command: CommandLine = command
+        self.pq: asyncio.Queue = print_queue
+        self.jobs: JobRegistry = JobRegistry()
+
+    async def main(self) -> None:
+        """
+        Coroutine that starts command logic
+
+        :returns: None
+        """
+        await self.execute()
+
+    async def execute(self) -> None:
+        """
+        Coroutine that handles any execution logic
+
+        :returns: None
+        """
+        if not self.command.args:
+            await self.pq.put(('error', f"Usage: {self.helper['usage']}\n"))
+            return
+
+        job = self.jobs.get_job(self.command.args[0])
+        if job is None:
+            await self.pq.put(('error', f"No job with id '{self.command.args[0]}'\n"))
+            return
+        if job.task is asyncio.current_task():
+            # A background 'wait <own id> &' would otherwise never finish
+            await self.pq.put(('error', f"[{job.id}] cannot wait for itself\n"))
+            return
+        await asyncio.wait([job.task])
+        await self.pq.put(f"[{job.id}] {job.state} after {job.runtime():.1f}s\n")
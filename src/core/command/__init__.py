@@ -1,4 +1,52 @@
-import glob
-from os.path import dirname, basename, isfile, join
-modules = glob.glob(join(dirname(__file__), "*.py"))
-__all__ = [basename(f)[:-3] for f in modules if isfile(f) and not f.endswith('__init__.py')]
+# Command manifest: module name => helper metadata. Modules are imported by the
+# CommandIndex on first dispatch, 'help' and completion only need this table.
+# It is the only copy of that metadata, each command class reads its helper from here.
+manifest: dict = {
+    'ExitCommand': {
+        'name': 'exit',
+        'help': 'This command will exit the application',
+        'usage': 'exit',
+        'aliases': ['quit']
+    },
+    'HelpCommand': {
+        'name': 'help',
+        'help': 'This command prints all available help information',
+        'usage': 'help'
+    },
+    'JobsCommand': {
+        'name': 'jobs',
+        'help': 'This command lists background jobs, or prints the output of one job',
+        'usage': 'jobs [id]'
+    },
+    'KillCommand': {
+        'name': 'kill',
+        'help': 'This command cancels a background job',
+        'usage': 'kill <id>'
+    },
+    'OptionsCommand': {
+        'name': 'options',
+        'help': 'This command prints all available options',
+        'usage': 'options'
+    },
+    'RunCommand': {
+        'name': 'run',
+        'help': 'This command will start the connection process',
+        'usage': 'run'
+    },
+    'SetCommand': {
+        'name': 'set',
+        'help': 'This command will set an option value',
+        'usage': 'set <key> <value>'
+    },
+    'StatsCommand': {
+        'name': 'stats',
+        'help': 'This command prints runtime instrumentation statistics',
+        'usage': 'stats'
+    },
+    'WaitCommand': {
+        'name': 'wait',
+        'help': 'This command waits for a background job to finish',
+        'usage': 'wait <id>'
+    }
+}
+__all__ = list(manifest)
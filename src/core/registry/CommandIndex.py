@@ -0,0 +1,127 @@
+import asyncio
+import importlib
+
+from src.core.utils.trie import PrefixTrie
+from src.core.command import manifest
+from src.core.registry.CommandRegistry import CommandRegistry, global_command_registry
+
+
+class AmbiguousCommandError(LookupError):
+
+    def __init__(self, name: str, matches: list):
+        """
+        Class "initializer"
+
+        :param name: User-supplied abbreviation
+        :param matches: Names of the commands the abbreviation matches
+        """
+        super().__init__(f"Ambiguous command '{name}': {', '.join(matches)}")
+        self.name: str = name
+        self.matches: list = matches
+
+
+class CommandIndex(object):
+
+    def __init__(self):
+        """
+        Class "initializer"
+
+        Dispatch index over the command manifest and the global command registry.
+        Command names and aliases map straight to their classes and a prefix trie
+        resolves unambiguous abbreviations ('opt' => 'options'). Manifest entries
+        map to their module name until the first dispatch imports them.
+        """
+        self.names: dict = {}
+        self.primary: dict = {}
+        self.helpers: dict = {}
+        self.trie: PrefixTrie = PrefixTrie()
+        self._indexed: int = 0
+        self._version: int = -1
+
+        for module, helper in manifest.items():
+            self._add(helper, module)
+
+    def sync(self) -> None:
+        """
+        Method that indexes any command registered since the last sync
+
+        :return: None
+        """
+        if self._version == CommandRegistry.version:
+            return
+        for cls in list(global_command_registry.values())[self._indexed:]:
+            if asyncio.iscoroutinefunction(cls.main):
+                self._add(getattr(cls, 'helper', {}), cls)
+        self._indexed = len(global_command_registry)
+        self._version = CommandRegistry.version
+
+    def _add(self, helper: dict, target) -> None:
+        """
+        Method that adds a command under its name and aliases
+
+        :param helper: Command helper metadata
+        :param target: Command class, or module name of a command not loaded yet
+        :return: None
+        """
+        if not helper.get('name'):
+            return
+        self.helpers[helper['name']] = helper
+        for name in [helper['name']] + list(helper.get('aliases', [])):
+            # A loaded class replaces the module placeholder from the manifest
+            if isinstance(self.names.get(name, str()), str):
+                self.names[name] = target
+                self.primary[name] = helper['name']
+                self.trie.insert(name)
+
+    def _load(self, module: str):
+        """
+        Method that imports a manifest command module on first dispatch
+
+        :param module: Command module name
+        :return: Command class or None
+        """
+        imported = importlib.import_module(f'src.core.command.{module}')
+        self.sync()
+        for cls in global_command_registry.values():
+            if cls.__module__ == imported.__name__:
+                for name in [n for n, target in self.names.items() if target == module]:
+                    self.names[name] = cls
+                return cls
+
+    def canonical(self, name: str):
+        """
+        Method that resolves a command name, alias or abbreviation to the command name without loading it
+
+        :param name: User-supplied command name
+        :return: Command name or None
+        """
+        self.sync()
+        if name in self.primary:
+            return self.primary[name]
+        if not name:
+            return None
+        matches: set = {self.primary[word] for word in self.trie.find(name)}
+        return matches.pop() if len(matches) == 1 else None
+
+    def resolve(self, name: str):
+        """
+        Method that resolves a command name, alias or abbreviation
+
+        :param name: User-supplied command name
+        :return: Command class or None when nothing matches
+        :raises AmbiguousCommandError: The abbreviation matches more than one command
+        """
+        self.sync()
+        target = self.names.get(name)
+        if target is None and name:
+            # An abbreviation may match a command name and its aliases at once
+            matches: set = {self.names[word] for word in self.trie.find(name)}
+            if len(matches) > 1:
+                raise AmbiguousCommandError(name, sorted({self.primary[word] for word in self.trie.find(name)}))
+            target = matches.pop() if matches else None
+        if isinstance(target, str):
+            target = self._load(target)
+        return target
+
+
+global_command_index: CommandIndex = CommandIndex()
@@ -3,6 +3,9 @@ global_command_registry: dict = {}
 
 class CommandRegistry(object):
 
+    version: int = 0
+
     def __init__(self, cls):
         if cls.__name__ not in global_command_registry:
             global_command_registry[cls.__name__] = cls
+            CommandRegistry.version += 1
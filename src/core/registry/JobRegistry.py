@@ -0,0 +1,134 @@
+import asyncio
+import time
+
+from collections import deque
+
+from src.core.utils.message import Message, MessageWriter
+from src.core.utils.parser import CommandLine
+
+global_job_registry: dict = {}
+
+
+class Job(object):
+
+    __slots__ = ('id', 'command', 'task', 'state', 'started', 'finished', 'output')
+
+    def __init__(self, job_id: int, command: CommandLine, output_limit: int):
+        self.id: int = job_id
+        self.command: CommandLine = command
+        self.task = None
+        self.state: str = 'pending'
+        self.started: float = 0.0
+        self.finished: float = 0.0
+        self.output: deque = deque(maxlen=output_limit)
+
+    def runtime(self) -> float:
+        if not self.started:
+            return 0.0
+        return (self.finished or time.time()) - self.started
+
+
+class JobOutput(MessageWriter):
+
+    def __init__(self, print_queue: asyncio.Queue, source: str):
+        """
+        Class "initializer"
+
+        Message writer handed to a background command, it records every
+        message in the job output before forwarding it to the print queue.
+
+        :param print_queue: Asynchronous print queue
+        :param source: Name of the command
+        """
+        super().__init__(print_queue, source)
+        self.job: Job = None
+
+    async def put(self, item) -> None:
+        message: Message = self.message(item)
+        self.job.output.append(message)
+        await self.print_queue.put(message)
+
+    def put_nowait(self, item) -> None:
+        message: Message = self.message(item)
+        self.job.output.append(message)
+        self.print_queue.put_nowait(message)
+
+
+class JobRegistry(object):
+
+    limit: int = 4
+    output_limit: int = 1000
+    history: int = 50
+    failed: int = 0
+    _next_id: int = 1
+    _semaphore: asyncio.Semaphore = None
+
+    @staticmethod
+    def set_limit(limit: int) -> None:
+        JobRegistry.limit = limit
+        JobRegistry._semaphore = None
+
+    @staticmethod
+    def submit(command: CommandLine, cls, output: JobOutput) -> Job:
+        if JobRegistry._semaphore is None:
+            JobRegistry._semaphore = asyncio.Semaphore(JobRegistry.limit)
+        JobRegistry._prune()
+        job: Job = Job(JobRegistry._next_id, command, JobRegistry.output_limit)
+        JobRegistry._next_id += 1
+        output.job = job
+        job.task = asyncio.create_task(JobRegistry._run(job, cls, output, JobRegistry._semaphore),
+                                       name=f'Task-Job-{job.id}')
+        global_job_registry[job.id] = job
+        return job
+
+    @staticmethod
+    async def _run(job: Job, cls, output: JobOutput, semaphore: asyncio.Semaphore) -> None:
+        try:
+            async with semaphore:
+                job.state = 'running'
+                job.started = time.time()
+                await cls(job.command, output).main()
+            # A command that reported an error on the queue failed as well
+            job.state = 'failed' if output.failed else 'done'
+            if output.failed:
+                JobRegistry.failed += 1
+        except asyncio.CancelledError:
+            job.state = 'cancelled'
+            raise
+        except Exception as e:
+            job.state = 'failed'
+            JobRegistry.failed += 1
+            await output.put(('error', f"[{job.id}] '{job.command}' failed: {e}\n"))
+        finally:
+            job.finished = time.time()
+
+    @staticmethod
+    def _prune() -> None:
+        # Forget the oldest finished jobs, and their captured output, beyond the history limit
+        finished: list = [job_id for job_id, job in global_job_registry.items() if job.task.done()]
+        for job_id in finished[:max(len(finished) - JobRegistry.history, 0)]:
+            del global_job_registry[job_id]
+
+    @staticmethod
+    def get_job(job_id: str) -> Job:
+        try:
+            return global_job_registry.get(int(job_id))
+        except ValueError:
+            return None
+
+    @staticmethod
+    def get_jobs() -> list:
+        return list(global_job_registry.values())
+
+    @staticmethod
+    async def wait_jobs() -> None:
+        tasks: list = [job.task for job in global_job_registry.values() if not job.task.done()]
+        if tasks:
+            await asyncio.wait(tasks)
+
+    @staticmethod
+    async def cancel_jobs() -> None:
+        tasks: list = [job.task for job in global_job_registry.values() if not job.task.done()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
@@ -1,6 +1,12 @@
+from types import MappingProxyType
+
+from src.core.utils.trie import PrefixTrie
 from src.core.utils.colors import colors
 
 global_option_registry: dict = {}
+global_option_index: dict = {}
+global_option_allowed: dict = {}
+global_option_trie: PrefixTrie = PrefixTrie()
 
 _colors: dict = colors()
 red = _colors['red']
@@ -10,44 +16,73 @@ reset = _colors['reset']
 
 class OptionRegistry(object):
 
+    version: int = 0
+    _snapshot_version: int = -1
+    _snapshot_dict: MappingProxyType = MappingProxyType({})
+    _snapshot_pairs: MappingProxyType = MappingProxyType({})
+
     @staticmethod
     def register_options(options: dict) -> None:
         for a in options:
-            options[a] = dict((k.lower(), v) for k, v in options[a].items() for a in options)
-            global_option_registry.update(options)
+            options[a] = {k.lower(): v for k, v in options[a].items()}
+        global_option_registry.update(options)
 
-    @staticmethod
-    def get_register_dict() -> dict:
-        return global_option_registry
+        # Flat key => namespace index and the pre-split allowed values of every option
+        for ns in options:
+            for key, value in options[ns].items():
+                _possible: list = value[2].replace(' ', '').split(',') if value[2] else []
+                global_option_index[key] = ns
+                global_option_allowed[key] = (frozenset(_possible), _possible)
+                global_option_trie.insert(key)
+        OptionRegistry.version += 1
 
     @staticmethod
-    def get_registry_pairs() -> dict:
+    def _snapshot() -> None:
+        if OptionRegistry._snapshot_version == OptionRegistry.version:
+            return
+        namespaces: dict = {}
         pairs: dict = {}
         for ns in global_option_registry:
-            pairs.update(global_option_registry[ns])
-        return pairs
+            options: dict = {k: tuple(v) for k, v in global_option_registry[ns].items()}
+            namespaces[ns] = MappingProxyType(options)
+            pairs.update(options)
+        OptionRegistry._snapshot_dict = MappingProxyType(namespaces)
+        OptionRegistry._snapshot_pairs = MappingProxyType(pairs)
+        OptionRegistry._snapshot_version = OptionRegistry.version
+
+    @staticmethod
+    def get_register_dict() -> MappingProxyType:
+        OptionRegistry._snapshot()
+        return OptionRegistry._snapshot_dict
+
+    @staticmethod
+    def get_registry_pairs() -> MappingProxyType:
+        OptionRegistry._snapshot()
+        return OptionRegistry._snapshot_pairs
 
     @staticmethod
     def get_register_value(key: str) -> str:
-        for a in global_option_registry:
-            if key in global_option_registry[a]:
-                return global_option_registry[a][key][0]
+        ns: str = global_option_index.get(key.lower())
+        if ns is not None:
+            return global_option_registry[ns][key.lower()][0]
+
+    @staticmethod
+    def complete_keys(prefix: str) -> set:
+        return global_option_trie.find(prefix.lower())
+
+    @staticmethod
+    def get_allowed_values(key: str) -> list:
+        _allowed: tuple = global_option_allowed.get(key.lower())
+        return _allowed[1] if _allowed else []
 
     @staticmethod
     def set_register_value(key: str, value: str) -> str:
-        try:
-            for a in global_option_registry:
-                if key.lower() not in str(global_option_registry[a]).lower():
-                    continue
-                _required: str = global_option_registry[a][key.lower()][2]
-                if not _required:
-                    global_option_registry[a][key.lower()][0] = value
-                    return f"{key} => {value}\n"
-                elif value in _required.replace(' ', '').split(','):
-                    global_option_registry[a][key.lower()][0] = value
-                    return f"{key} => {value}\n"
-                else:
-                    _possible = _required.replace(' ','').split(',')
-                    return f"{value} is not in the list of allowed values: {_possible}\n"
-        except KeyError:
-            pass
+        ns: str = global_option_index.get(key.lower())
+        if ns is None:
+            return
+        _allowed, _possible = global_option_allowed[key.lower()]
+        if _possible and value not in _allowed:
+            return f"{value} is not in the list of allowed values: {_possible}\n"
+        global_option_registry[ns][key.lower()][0] = value
+        OptionRegistry.version += 1
+        return f"{key} => {value}\n"
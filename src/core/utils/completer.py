@@ -0,0 +1,56 @@
+from prompt_toolkit.completion import Completer, Completion
+
+from src.core.utils.parser import partial_words
+from src.core.registry.CommandIndex import CommandIndex
+from src.core.registry.OptionsRegistry import OptionRegistry
+
+
+class ConsoleCompleter(Completer):
+
+    def __init__(self, commands: CommandIndex, options: OptionRegistry):
+        """
+        Class "initializer"
+
+        Completes command names, option keys after 'set' and the allowed values
+        of an option, in any of the forms the command line parser accepts.
+        Lookups go through the prefix tries kept by the command index and the
+        option registry, which are updated as commands and options register,
+        so a keystroke never rescans the registries.
+
+        :param commands: Command dispatch index
+        :param options: Option registry
+        """
+        self.commands: CommandIndex = commands
+        self.options: OptionRegistry = options
+
+    def get_completions(self, document, complete_event):
+        """
+        Method that yields the completions for the text before the cursor
+
+        :param document: Prompt document
+        :param complete_event: Completion event
+        :return: Completion generator
+        """
+        words: list = partial_words(document.text_before_cursor)
+        word: str = words[-1].value
+        start: int = words[-1].start - len(document.text_before_cursor)
+
+        if len(words) == 1:
+            self.commands.sync()
+            candidates = self.commands.trie.find(word)
+        elif self.commands.canonical(words[0].value) != 'set':
+            return
+        elif len(words) == 2 and words[1].eq > 0:
+            # 'set key=value', complete the value after the '='
+            key, word = word[:words[1].eq], word[words[1].eq + 1:]
+            start = -len(word)
+            candidates = [v for v in self.options.get_allowed_values(key) if v.startswith(word)]
+        elif len(words) == 2:
+            candidates = self.options.complete_keys(word)
+        elif len(words) == 3 or (len(words) == 4 and words[2].value == '=' and words[2].eq == 0):
+            candidates = [v for v in self.options.get_allowed_values(words[1].value) if v.startswith(word)]
+        else:
+            return
+
+        for candidate in sorted(candidates):
+            yield Completion(candidate, start_position=start)
@@ -0,0 +1,68 @@
+import json
+import marshal
+import os
+
+_cache_format: int = 1
+
+
+def _parse(path: str) -> dict:
+    """
+    Function that parses the configuration file, plain JSON first then YAML
+
+    :param path: Configuration file path
+    :return: Parsed option tree
+    """
+    with open(path, 'r') as conf:
+        text: str = conf.read()
+    try:
+        return json.loads(text)
+    except ValueError:
+        pass
+
+    from ruamel.yaml import YAML, YAMLError
+    try:
+        return YAML().load(text)
+    except YAMLError as e:
+        raise ValueError(str(e))
+
+
+def _normalize(options: dict) -> dict:
+    """
+    Function that compiles the parsed tree into plain containers with lower-case keys
+
+    :param options: Parsed option tree
+    :return: Normalized option tree
+    """
+    return {str(ns): {str(k).lower(): list(v) for k, v in options[ns].items()} for ns in options}
+
+
+def load_config(path: str) -> dict:
+    """
+    Function that loads the normalized option tree, using the compiled cache when it is current
+
+    The cache lives next to the configuration file and is keyed on its absolute
+    path, mtime and size, so the file is only parsed again after it changes.
+
+    :param path: Configuration file path
+    :return: Normalized option tree
+    """
+    stat = os.stat(path)
+    key: tuple = (_cache_format, os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+    cache: str = os.path.join(os.path.dirname(path), f'.{os.path.basename(path)}.cache')
+
+    try:
+        with open(cache, 'rb') as f:
+            cached_key, options = marshal.load(f)
+        if cached_key == key:
+            return options
+    except (OSError, EOFError, ValueError, TypeError):
+        pass
+
+    options: dict = _normalize(_parse(path))
+    try:
+        with open(f'{cache}.tmp', 'wb') as f:
+            marshal.dump((key, options), f)
+        os.replace(f'{cache}.tmp', cache)
+    except (OSError, ValueError):
+        pass
+    return options
@@ -0,0 +1,64 @@
+import time
+
+
+class JsonlSink(object):
+
+    def __init__(self, path: str, max_bytes: int = 65536, max_delay: float = 1.0):
+        """
+        Class "initializer"
+
+        Buffered JSONL session log. Messages are appended to an in-memory buffer
+        which is written out once it reaches max_bytes or once max_delay seconds
+        have passed since the last write.
+
+        :param path: Log file path
+        :param max_bytes: Buffered size that triggers a flush
+        :param max_delay: Seconds before buffered messages are flushed
+        """
+        self.path: str = path
+        self.max_bytes: int = max_bytes
+        self.max_delay: float = max_delay
+        self.buffer: list = []
+        self.size: int = 0
+        self.flushed: float = time.monotonic()
+        self.file = open(path, 'a', encoding='utf-8')
+
+    @property
+    def pending(self) -> bool:
+        return bool(self.buffer)
+
+    def write(self, messages: list) -> None:
+        """
+        Method that buffers messages, flushing when a threshold is reached
+
+        :param messages: List of Message records
+        :return: None
+        """
+        for message in messages:
+            line: str = f'{message.to_json()}\n'
+            self.buffer.append(line)
+            self.size += len(line)
+        if self.size >= self.max_bytes or time.monotonic() - self.flushed >= self.max_delay:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Method that writes the buffered messages to the log file
+
+        :return: None
+        """
+        if self.buffer:
+            self.file.write(''.join(self.buffer))
+            self.file.flush()
+            self.buffer, self.size = [], 0
+        self.flushed = time.monotonic()
+
+    def close(self) -> None:
+        """
+        Method that flushes and closes the log file
+
+        :return: None
+        """
+        if not self.file.closed:
+            self.flush()
+            self.file.close()
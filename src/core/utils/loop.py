@@ -0,0 +1,53 @@
+import asyncio
+import sys
+
+backends: tuple = ('asyncio', 'uvloop')
+
+
+def loop_factory(backend: str):
+    """
+    Returns the event loop factory of a backend
+
+    :param backend: Event loop backend name
+    :return: Callable creating a new event loop
+    """
+    if backend == 'asyncio':
+        return asyncio.new_event_loop
+    if backend == 'uvloop':
+        import uvloop
+        return uvloop.new_event_loop
+    raise ValueError(f"Unknown event loop backend '{backend}'")
+
+
+def available() -> list:
+    """
+    Returns the event loop backends that can be used in this environment
+
+    :return: List of backend names
+    """
+    _available: list = []
+    for backend in backends:
+        try:
+            loop_factory(backend)
+            _available.append(backend)
+        except ImportError:
+            pass
+    return _available
+
+
+def run(main, backend: str = 'asyncio'):
+    """
+    Runs a coroutine to completion on a fresh event loop of the given backend
+
+    :param main: Coroutine to run
+    :param backend: Event loop backend name
+    :return: Result of the coroutine
+    """
+    factory = loop_factory(backend)
+    if sys.version_info >= (3, 11):
+        with asyncio.Runner(loop_factory=factory) as runner:
+            return runner.run(main)
+    if backend == 'uvloop':
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return asyncio.run(main)
@@ -0,0 +1,86 @@
+import json
+import time
+
+
+class Message(object):
+
+    __slots__ = ('level', 'timestamp', 'source', 'text', 'end')
+
+    def __init__(self, text: str, level: str = 'info', source: str = '', timestamp: float = None, end: str = '\n'):
+        """
+        Class "initializer"
+
+        :param text: Message text
+        :param level: Message level, also selects the terminal style
+        :param source: Name of the command that produced the message
+        :param timestamp: Creation time, defaults to now
+        :param end: Printed after the text, empty for a piece of a line cut into chunks
+        """
+        self.text: str = text
+        self.level: str = level
+        self.source: str = source
+        self.timestamp: float = time.time() if timestamp is None else timestamp
+        self.end: str = end
+
+    @staticmethod
+    def from_item(item, source: str = ''):
+        """
+        Converts a print queue item into a Message
+
+        :param item: Message, '(level, text)' tuple or plain text
+        :param source: Name of the command that produced the item
+        :return: Message
+        """
+        if isinstance(item, Message):
+            return item
+        if isinstance(item, tuple):
+            return Message(f'{item[1]}', item[0], source)
+        return Message(f'{item}', 'info', source)
+
+    def copy(self, text: str, end: str = '\n'):
+        """
+        Returns a Message with the same metadata and a different text
+
+        :param text: Message text
+        :param end: Printed after the text
+        :return: Message
+        """
+        return Message(text, self.level, self.source, self.timestamp, end)
+
+    def to_json(self) -> str:
+        """
+        Serializes the Message as a single JSON line
+
+        :return: JSON string
+        """
+        return json.dumps({'time': self.timestamp, 'level': self.level, 'source': self.source, 'text': self.text},
+                          separators=(',', ':'))
+
+
+class MessageWriter(object):
+
+    def __init__(self, print_queue, source: str):
+        """
+        Class "initializer"
+
+        Print queue proxy handed to a command, it tags everything the command
+        prints with the command name and notes whether it reported an error.
+
+        :param print_queue: Asynchronous print queue
+        :param source: Name of the command
+        """
+        self.print_queue = print_queue
+        self.source: str = source
+        self.failed: bool = False
+
+    def message(self, item) -> Message:
+        message: Message = Message.from_item(item, self.source)
+        if message.level == 'error':
+            self.failed = True
+        return message
+
+    async def put(self, item) -> None:
+        await self.print_queue.put(self.message(item))
+
+    def put_nowait(self, item) -> None:
+        self.print_queue.put_nowait(self.message(item))
@@ -0,0 +1,228 @@
+import re
+
+# One lexeme per match: blanks, an operator, an escape, a quoted string or a run of plain characters.
+# '&' is only an operator on its own, so it can appear inside a word such as a password.
+_lexeme = re.compile(r"""
+    (?P<blank>[^\S\n]+)
+  | (?P<op>[;\n]|&(?=[^\S\n]|[;\n]|$))
+  | (?P<escape>\\(?:\r?\n|.)?)
+  | (?P<single>'[^']*(?P<single_end>')?)
+  | (?P<double>"(?:[^"\\]|\\.)*(?P<double_end>")?)
+  | (?P<plain>[^\s;'"\\]+)
+""", re.VERBOSE | re.DOTALL)
+
+_double_escape = re.compile(r'\\([\\"])')
+
+
+class ParseError(ValueError):
+
+    def __init__(self, message: str, lineno: int = 1, incomplete: str = ''):
+        """
+        Class "initializer"
+
+        :param message: Description of the syntax error
+        :param lineno: Line of the input the error was found on
+        :param incomplete: What more input needs to complete the text, the open quote or '\\n' after a
+                           trailing escape, empty for an error more input cannot fix
+        """
+        super().__init__(f'{message} (line {lineno})' if lineno > 1 else message)
+        self.lineno: int = lineno
+        self.incomplete: str = incomplete
+
+
+class Word(object):
+
+    __slots__ = ('value', 'eq', 'start', 'end')
+
+    def __init__(self, value: str, eq: int, start: int, end: int):
+        """
+        Class "initializer"
+
+        :param value: Word with quotes and escapes removed
+        :param eq: Index of the first unquoted '=' in the value, -1 when there is none
+        :param start: Offset of the word in the source text
+        :param end: Offset past the end of the word in the source text
+        """
+        self.value: str = value
+        self.eq: int = eq
+        self.start: int = start
+        self.end: int = end
+
+
+class CommandLine(object):
+
+    __slots__ = ('name', 'args', 'params', 'background', 'text', 'lineno')
+
+    def __init__(self, name: str, args: tuple = (), params: dict = None, background: bool = False,
+                 text: str = '', lineno: int = 1):
+        """
+        Class "initializer"
+
+        Parsed form of a single command, shared by the dispatcher, the job
+        registry and the command classes so a line is only tokenized once.
+
+        :param name: Command name or abbreviation, as typed
+        :param args: Positional arguments
+        :param params: First argument given as key=value or key = value
+        :param background: True when the command was terminated by '&'
+        :param text: Source text of the command, for display
+        :param lineno: Line of the input the command starts on
+        """
+        self.name: str = name
+        self.args: tuple = args
+        self.params: dict = params if params is not None else {}
+        self.background: bool = background
+        self.text: str = text or ' '.join((name,) + args)
+        self.lineno: int = lineno
+
+    def __str__(self) -> str:
+        return self.text
+
+    def __repr__(self) -> str:
+        return f'CommandLine({self.text!r})'
+
+
+def _words(text: str, strict: bool = True, first_line: int = 1):
+    """
+    Generator that splits the text into words and operators
+
+    Quoting follows the POSIX shell: single quotes are literal, double quotes
+    honour backslash escapes of '\\' and '"', and an unquoted backslash escapes
+    the next character or joins the next line. A '#' where a command would
+    start comments out the rest of the line.
+
+    :param text: Source text
+    :param strict: Raise ParseError on malformed input instead of recovering, for completion
+    :param first_line: Line number of the start of the text, for error messages
+    :return: Generator of Word records, operators are yielded as plain strings
+    """
+    pos: int = 0
+    size: int = len(text)
+    parts: list = []
+    eq: int = -1
+    length: int = 0
+    start: int = 0
+    empty: bool = True
+    while pos < size:
+        if empty and not parts and text[pos] == '#':
+            pos = text.find('\n', pos)
+            if pos < 0:
+                break
+            continue
+        # The alternatives cover every character, so there is always a match
+        match = _lexeme.match(text, pos)
+        kind: str = match.lastgroup
+        lexeme: str = match.group()
+        if kind == 'blank' or kind == 'op':
+            if parts:
+                yield Word(''.join(parts), eq, start, pos)
+                parts, eq, length, empty = [], -1, 0, False
+            if kind == 'op':
+                if lexeme == '&' and empty and strict:
+                    raise ParseError("Syntax error near unexpected '&'", _lineno(text, pos, first_line))
+                empty = True
+                yield lexeme
+            pos = match.end()
+            continue
+
+        if kind == 'escape' and lexeme[1:] in ('\n', '\r\n'):
+            if match.end() == size and strict:
+                raise ParseError('Unexpected end of input after escape', _lineno(text, pos, first_line), '\n')
+            # An escaped new line joins the next line
+            pos = match.end()
+            continue
+        if not parts:
+            start = pos
+        if kind == 'plain':
+            if eq < 0 and '=' in lexeme:
+                eq = length + lexeme.index('=')
+            part: str = lexeme
+        elif kind == 'escape':
+            if len(lexeme) == 1 and strict:
+                raise ParseError('Unexpected end of input after escape', _lineno(text, pos, first_line), '\n')
+            part: str = lexeme[1:]
+        elif kind == 'single':
+            if match.group('single_end') is None and strict:
+                raise ParseError('Unterminated single quote', _lineno(text, pos, first_line), "'")
+            part: str = lexeme[1:-1] if match.group('single_end') else lexeme[1:]
+        else:
+            if match.group('double_end') is None and strict:
+                raise ParseError('Unterminated double quote', _lineno(text, pos, first_line), '"')
+            part: str = _double_escape.sub(r'\1', lexeme[1:-1] if match.group('double_end') else lexeme[1:])
+        # An empty quoted string still makes a word
+        parts.append(part)
+        length += len(part)
+        pos = match.end()
+    if parts:
+        yield Word(''.join(parts), eq, start, pos)
+
+
+def _lineno(text: str, pos: int, first_line: int = 1) -> int:
+    return text.count('\n', 0, pos) + first_line
+
+
+def _command(text: str, words: list, background: bool, lineno: int) -> CommandLine:
+    # Only the first argument can be an assignment, later words are kept as typed ('set key a=b' sets 'a=b')
+    args: list = [word.value for word in words[1:]]
+    params: dict = {}
+    if len(words) > 1 and words[1].eq > 0:
+        params[words[1].value[:words[1].eq]] = words[1].value[words[1].eq + 1:]
+        del args[0]
+    elif len(words) > 2 and words[2].eq == 0 and words[2].value == '=':
+        params[words[1].value] = words[3].value if len(words) > 3 else ''
+        del args[:3]
+    return CommandLine(words[0].value, tuple(args), params, background,
+                       text[words[0].start:words[-1].end], lineno)
+
+
+def parse(text: str, first_line: int = 1) -> list:
+    """
+    Function that parses command lines into CommandLine records
+
+    Commands are separated by ';', a new line or a standalone '&', and a
+    command terminated by '&' runs in the background. The whole of a script
+    can be parsed in one call, before any of it runs.
+
+    :param text: One or more command lines
+    :param first_line: Line number of the start of the text, when it is a piece of a larger script
+    :return: List of CommandLine records, in order
+    """
+    commands: list = []
+    words: list = []
+    lineno: int = first_line
+    counted: int = 0
+    for word in _words(text, first_line=first_line):
+        if isinstance(word, Word):
+            words.append(word)
+            continue
+        if not words:
+            continue
+        lineno += text.count('\n', counted, words[0].start)
+        counted = words[0].start
+        commands.append(_command(text, words, word == '&', lineno))
+        words = []
+    if words:
+        lineno += text.count('\n', counted, words[0].start)
+        commands.append(_command(text, words, False, lineno))
+    return commands
+
+
+def partial_words(text: str) -> list:
+    """
+    Function that returns the words of the last command of a partially typed line
+
+    Unterminated quotes are closed at the end of the text. When the text ends
+    between words an empty word is appended for the one about to be typed.
+
+    :param text: Text before the cursor
+    :return: List of Word records, the last one is the word under the cursor
+    """
+    words: list = []
+    for word in _words(text, strict=False):
+        if isinstance(word, Word):
+            words.append(word)
+        else:
+            words = []
+    if not words or words[-1].end < len(text):
+        words.append(Word('', -1, len(text), len(text)))
+    return words
@@ -0,0 +1,82 @@
+import asyncio
+
+from src.core.utils.message import Message
+
+
+class PrintQueue(asyncio.Queue):
+
+    def __init__(self, maxsize: int = 0, chunk_size: int = 4096):
+        """
+        Class "initializer"
+
+        :param maxsize: Maximum queued messages before producers wait (0 is unbounded)
+        :param chunk_size: Character count above which messages are streamed in chunks
+        """
+        super().__init__(maxsize)
+        self.chunk_size: int = chunk_size
+        self.high_water_mark: int = 0
+
+    def put_nowait(self, item) -> None:
+        """
+        Method that queues a message without waiting and tracks the queue high-water mark
+
+        Large payloads are chunked as in put. On a bounded queue without room for
+        every chunk nothing is queued and asyncio.QueueFull is raised, so callers
+        that cannot handle it should use put.
+
+        :param item: Message, '(level, text)' tuple or plain text
+        :return: None
+        """
+        chunks: list = self.chunks(Message.from_item(item))
+        if self.maxsize and self.qsize() + len(chunks) > self.maxsize:
+            raise asyncio.QueueFull
+        for chunk in chunks:
+            super().put_nowait(chunk)
+        size: int = self.qsize()
+        if size > self.high_water_mark:
+            self.high_water_mark = size
+
+    async def put(self, item) -> None:
+        """
+        Coroutine that queues a message, splitting large payloads into chunks
+
+        Every chunk waits for room in a bounded queue, so a large table streams
+        out as the print processor drains it instead of being held in memory.
+
+        :param item: Message, '(level, text)' tuple or plain text
+        :return: None
+        """
+        for chunk in self.chunks(Message.from_item(item)):
+            await super().put(chunk)
+
+    def chunks(self, item: Message) -> list:
+        """
+        Method that splits a message into chunks on line boundaries
+
+        A line longer than a chunk is also cut by length, its pieces are printed
+        without a line break between them.
+
+        :param item: Message to print
+        :return: List of messages
+        """
+        text: str = item.text
+        if len(text) <= self.chunk_size:
+            return [item]
+
+        chunks: list = []
+        lines: list = []
+        size: int = 0
+        for line in text.split('\n'):
+            while len(line) > self.chunk_size:
+                if lines:
+                    chunks.append(item.copy('\n'.join(lines)))
+                    lines, size = [], 0
+                chunks.append(item.copy(line[:self.chunk_size], ''))
+                line = line[self.chunk_size:]
+            if lines and size + len(line) > self.chunk_size:
+                chunks.append(item.copy('\n'.join(lines)))
+                lines, size = [], 0
+            lines.append(line)
+            size += len(line) + 1
+        chunks.append(item.copy('\n'.join(lines), item.end))
+        return chunks
@@ -0,0 +1,125 @@
+import asyncio
+import functools
+import time
+
+
+class Histogram(object):
+
+    __slots__ = ('count', 'total', 'max', 'buckets')
+
+    def __init__(self):
+        """
+        Class "initializer"
+
+        Log2-bucketed histogram, bucket i counts the values in [2^(i-1), 2^i).
+        """
+        self.count: int = 0
+        self.total: float = 0.0
+        self.max: float = 0.0
+        self.buckets: list = [0] * 48
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+        self.buckets[min(int(value).bit_length(), 47)] += 1
+
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, p: float) -> float:
+        """
+        Method that returns the upper bound of the bucket holding the percentile
+
+        :param p: Percentile between 0 and 100
+        :return: Approximate percentile value
+        """
+        rank: float = self.count * p / 100
+        seen: int = 0
+        for i, n in enumerate(self.buckets):
+            seen += n
+            if n and seen >= rank:
+                return min(float(2 ** i), self.max)
+        return self.max
+
+
+class Stats(object):
+
+    enabled: bool = False
+    latency: dict = {}
+    queue_depth: Histogram = Histogram()
+    queue_wait: Histogram = Histogram()
+    loop_lag: Histogram = Histogram()
+    print_queue: asyncio.Queue = None
+
+    @staticmethod
+    def record(name: str, seconds: float) -> None:
+        """
+        Records a latency sample, in microseconds, under the given name
+
+        :param name: Histogram name
+        :param seconds: Elapsed time in seconds
+        :return: None
+        """
+        histogram: Histogram = Stats.latency.get(name)
+        if histogram is None:
+            histogram = Stats.latency[name] = Histogram()
+        histogram.add(seconds * 1e6)
+
+    @staticmethod
+    def record_batch(depth: int, messages: list) -> None:
+        """
+        Records the print queue depth and the queue wait time of a printed batch
+
+        :param depth: Messages waiting when the batch was taken
+        :param messages: Printed Message records
+        :return: None
+        """
+        now: float = time.time()
+        Stats.queue_depth.add(depth)
+        for message in messages:
+            Stats.queue_wait.add((now - message.timestamp) * 1e6)
+
+    @staticmethod
+    def watch_queue(print_queue: asyncio.Queue) -> None:
+        """
+        Registers the print queue whose high-water mark and bound are reported
+
+        :param print_queue: Console print queue
+        :return: None
+        """
+        Stats.print_queue = print_queue
+
+    @staticmethod
+    def timed(name: str, func):
+        """
+        Wraps a coroutine function so its latency is recorded while instrumentation is enabled
+
+        :param name: Histogram name
+        :param func: Coroutine function
+        :return: Wrapped coroutine function
+        """
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            if not Stats.enabled:
+                return await func(*args, **kwargs)
+            start: float = time.perf_counter()
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                Stats.record(name, time.perf_counter() - start)
+        return wrapper
+
+    @staticmethod
+    async def monitor_loop(interval: float = 0.1) -> None:
+        """
+        Coroutine that samples event loop lag, the delay past each expected wake up
+
+        :param interval: Sampling interval in seconds
+        :return: None
+        """
+        while True:
+            start: float = time.perf_counter()
+            await asyncio.sleep(interval)
+            Stats.loop_lag.add(max(time.perf_counter() - start - interval, 0.0) * 1e6)
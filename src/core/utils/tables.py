@@ -1,12 +1,15 @@
-from prettytable import PrettyTable
+_rendered: dict = {}
 
 
 def create_table(field_names: list, field_values: list) -> str:
+    from prettytable import PrettyTable
+
     t = PrettyTable()
 
     t.border = False
     t.padding_width = 2
     t.field_names = field_names
+    t.align = 'l'
 
     sep = []
     for _value in field_names:
@@ -15,6 +18,37 @@ def create_table(field_names: list, field_values: list) -> str:
 
     for _value in field_values:
         t.add_row(_value)
-        t.align = 'l'
 
     return "{}".format(t.get_string())
+
+
+def format_table(field_names: list, field_values: list) -> str:
+    """
+    Dependency-free formatter producing the same borderless layout as create_table
+
+    :param field_names: Column headers
+    :param field_values: Table rows
+    :return: Rendered table
+    """
+    rows: list = [field_names, ['-' * len(_value) for _value in field_names]]
+    rows += [[str(_cell) for _cell in _value] for _value in field_values]
+    widths: list = [max(len(row[i]) for row in rows) for i in range(len(field_names))]
+    return '\n'.join(''.join(f'  {cell:<{width}}  ' for cell, width in zip(row, widths)) for row in rows)
+
+
+def cached_table(key: str, version: int, field_names: list, build) -> str:
+    """
+    Returns a rendered table, only formatting it again once the version changes
+
+    :param key: Cache key of the table
+    :param version: Version of the registry the table is built from
+    :param field_names: Column headers
+    :param build: Callable returning the table rows
+    :return: Rendered table
+    """
+    cached: tuple = _rendered.get(key)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+    output: str = format_table(field_names, build())
+    _rendered[key] = (version, output)
+    return output
@@ -0,0 +1,46 @@
+class _TrieNode(object):
+
+    __slots__ = ('children', 'words')
+
+    def __init__(self):
+        self.children: dict = {}
+        self.words: set = set()
+
+
+class PrefixTrie(object):
+
+    def __init__(self):
+        """
+        Class "initializer"
+
+        Every node keeps the set of words reachable below it, so resolving an
+        abbreviation or listing completions costs O(len(prefix)).
+        """
+        self.root: _TrieNode = _TrieNode()
+
+    def insert(self, word: str) -> None:
+        """
+        Method that adds a word to the trie
+
+        :param word: Word to index
+        :return: None
+        """
+        node: _TrieNode = self.root
+        node.words.add(word)
+        for char in word:
+            node = node.children.setdefault(char, _TrieNode())
+            node.words.add(word)
+
+    def find(self, prefix: str) -> set:
+        """
+        Method that returns every indexed word starting with the prefix
+
+        :param prefix: Word prefix
+        :return: Set of matching words (shared, do not mutate)
+        """
+        node: _TrieNode = self.root
+        for char in prefix:
+            node = node.children.get(char)
+            if node is None:
+                return set()
+        return node.words
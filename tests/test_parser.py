@@ -0,0 +1,141 @@
+import unittest
+
+from src.core.utils.parser import ParseError, parse, partial_words
+
+
+def _one(text: str):
+    commands: list = parse(text)
+    assert len(commands) == 1, commands
+    return commands[0]
+
+
+class TestQuoting(unittest.TestCase):
+
+    def test_plain_words(self):
+        line = _one('set ssh_bf_port 2222')
+        self.assertEqual(line.name, 'set')
+        self.assertEqual(line.args, ('ssh_bf_port', '2222'))
+        self.assertEqual(line.params, {})
+        self.assertFalse(line.background)
+
+    def test_single_quotes_are_literal(self):
+        self.assertEqual(_one(r"set k 'a \"b\" \n'").args, ('k', r'a \"b\" \n'))
+
+    def test_double_quotes_honour_escapes(self):
+        self.assertEqual(_one(r'set k "a \"b\" \\ \n"').args, ('k', r'a "b" \ \n'))
+
+    def test_empty_quotes_make_a_word(self):
+        self.assertEqual(_one('set k ""').args, ('k', ''))
+        self.assertEqual(_one("set k ''").args, ('k', ''))
+
+    def test_adjacent_parts_join(self):
+        self.assertEqual(_one('set k a"b c"\'d\'').args, ('k', 'ab cd'))
+
+    def test_unterminated_quotes(self):
+        for text in ('set k "abc', "set k 'abc"):
+            with self.assertRaises(ParseError) as ctx:
+                parse(text)
+            self.assertTrue(ctx.exception.incomplete)
+
+
+class TestEscapes(unittest.TestCase):
+
+    def test_backslash_escapes_next_character(self):
+        self.assertEqual(_one(r'set k a\ b\;c\&').args, ('k', 'a b;c&'))
+
+    def test_line_continuation(self):
+        line = _one('set k a \\\n  b')
+        self.assertEqual(line.args, ('k', 'a', 'b'))
+        self.assertEqual(_one('set k a\\\r\nb').args, ('k', 'ab'))
+
+    def test_trailing_escape_is_incomplete(self):
+        for text in ('set k \\', 'set k a \\\n'):
+            with self.assertRaises(ParseError) as ctx:
+                parse(text)
+            self.assertTrue(ctx.exception.incomplete)
+
+
+class TestOperators(unittest.TestCase):
+
+    def test_semicolon_chains_commands(self):
+        self.assertEqual([c.name for c in parse('help; options;;jobs')], ['help', 'options', 'jobs'])
+
+    def test_standalone_ampersand_backgrounds(self):
+        commands: list = parse('run & jobs')
+        self.assertEqual([(c.name, c.background) for c in commands], [('run', True), ('jobs', False)])
+        self.assertTrue(_one('run &').background)
+
+    def test_ampersand_inside_a_word_is_text(self):
+        line = _one('set ssh_bf_password p&ss&')
+        self.assertEqual(line.args, ('ssh_bf_password', 'p&ss&'))
+        self.assertFalse(line.background)
+
+    def test_ampersand_without_command(self):
+        with self.assertRaises(ParseError) as ctx:
+            parse('help\n & ')
+        self.assertEqual(ctx.exception.lineno, 2)
+        self.assertFalse(ctx.exception.incomplete)
+
+    def test_comments_only_where_a_command_starts(self):
+        commands: list = parse('# setup\nhelp; # skipped\nset ssh_bf_password #x')
+        self.assertEqual([(c.name, c.args) for c in commands], [('help', ()), ('set', ('ssh_bf_password', '#x'))])
+
+    def test_line_numbers(self):
+        commands: list = parse('help\n\n# note\noptions; jobs\n', 10)
+        self.assertEqual([c.lineno for c in commands], [10, 13, 13])
+        self.assertEqual(str(commands[1]), 'options')
+
+
+class TestAssignments(unittest.TestCase):
+
+    def test_key_value(self):
+        line = _one('set ssh_bf_port=2222')
+        self.assertEqual(line.params, {'ssh_bf_port': '2222'})
+        self.assertEqual(line.args, ())
+
+    def test_spaced_key_value(self):
+        self.assertEqual(_one('set ssh_bf_port = 2222').params, {'ssh_bf_port': '2222'})
+        self.assertEqual(_one('set ssh_bf_port =').params, {'ssh_bf_port': ''})
+
+    def test_value_keeps_later_equals(self):
+        self.assertEqual(_one('set k=a=b').params, {'k': 'a=b'})
+
+    def test_only_first_argument_is_split(self):
+        line = _one('set ssh_bf_password abc=def')
+        self.assertEqual(line.params, {})
+        self.assertEqual(line.args, ('ssh_bf_password', 'abc=def'))
+
+    def test_quoting_disables_assignment(self):
+        self.assertEqual(_one("set 'k=v'").params, {})
+        self.assertEqual(_one('set k="a b"').params, {'k': 'a b'})
+
+
+class TestWhitespace(unittest.TestCase):
+
+    def test_unicode_whitespace_separates_words(self):
+        for blank in (' ', '\xa0', '\u2003', '\x1c', '\t', '\x0b', '\u3000'):
+            self.assertEqual(_one(f'set{blank}k{blank}v').args, ('k', 'v'))
+
+    def test_unicode_whitespace_in_partial_words(self):
+        self.assertEqual([w.value for w in partial_words('set\xa0ssh')], ['set', 'ssh'])
+
+    def test_blank_input(self):
+        self.assertEqual(parse(' \xa0\n\t'), [])
+
+
+class TestPartialWords(unittest.TestCase):
+
+    def test_next_word(self):
+        self.assertEqual([w.value for w in partial_words('set ')], ['set', ''])
+
+    def test_last_command_only(self):
+        self.assertEqual([w.value for w in partial_words('help; set k')], ['set', 'k'])
+
+    def test_open_quote(self):
+        words: list = partial_words('set k "a b')
+        self.assertEqual(words[-1].value, 'a b')
+        self.assertEqual(words[-1].start, 6)
+
+
+if __name__ == '__main__':
+    unittest.main()